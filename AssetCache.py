@@ -0,0 +1,134 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""Permet de conserver sur le disque les images déjà préparées."""
+
+# Documentation
+from typing import Callable
+
+# Modules standard
+import hashlib
+import os
+import struct
+import threading
+
+from PIL import Image  # type: ignore
+
+
+class AssetCache:
+    """Cache sur disque des images prêtes à afficher (RGBA brut).
+
+    Ne possède que des méthodes statiques. Essayer de l'instancier
+    causera une erreur.
+
+    Chaque image est enregistrée dans `directory` sous un nom dérivé de
+    son fichier source et de sa taille. L'entête du fichier contient
+    l'empreinte SHA-256 de la source et la version du traitement: si
+    l'une ou l'autre ne correspond plus, l'entrée est refaite.
+    Méthodes:
+        `AssetCache.load`: Retourne une image du cache, ou la prépare
+          et l'y enregistre.
+        `AssetCache.clear`: Vide le cache.
+    """
+    directory = os.path.join(
+        os.path.dirname(__file__),
+        "Data", "sprites",
+    )
+
+    HEADER = struct.Struct("<4sI32sII")
+    """Signature, version, empreinte de la source, largeur, hauteur"""
+    MAGIC = b"SFPX"
+
+    def __init__(self):
+        """Méthode explicitement interdite."""
+        raise RuntimeError("This class cannot be instantiated.")
+
+    @staticmethod
+    def path(file: str, dimensions: tuple[int, int]) -> str:
+        """Retourne le fichier du cache associé à une image et une
+        taille. Le nom contient une empreinte du chemin de l'image, pour
+        que deux images de même nom dans des dossiers différents (ou
+        dont le chemin contient `_`) n'aient pas le même fichier.
+        """
+        relative = os.path.normpath(file).replace(os.sep, "/")
+        key = hashlib.sha256(relative.encode()).hexdigest()[:16]
+        name = os.path.basename(relative)
+        width, height = dimensions
+        return os.path.join(
+            AssetCache.directory, f"{name}.{key}.{width}x{height}.rgba"
+        )
+
+    @staticmethod
+    def digest(file: str) -> bytes:
+        """Retourne l'empreinte SHA-256 du contenu d'un fichier."""
+        with open(file, "rb") as source:
+            return hashlib.sha256(source.read()).digest()
+
+    @staticmethod
+    def load(
+            file: str,
+            dimensions: tuple[int, int],
+            process: Callable[[str, tuple[int, int]], Image.Image],
+            version: int = 1
+    ) -> Image.Image:
+        """Retourne l'image préparée, depuis le cache si possible.
+
+        Args:
+            file: Le fichier source de l'image.
+            dimensions: La taille voulue.
+            process: Fonction qui prépare l'image (en RGBA) si elle
+              n'est pas dans le cache.
+            version: Version du traitement fait par `process`. La
+              changer invalide les entrées existantes.
+        """
+        digest = AssetCache.digest(file)
+        header = AssetCache.HEADER.pack(
+            AssetCache.MAGIC, version, digest, *dimensions
+        )
+        path = AssetCache.path(file, dimensions)
+
+        try:
+            with open(path, "rb") as cached:
+                if cached.read(AssetCache.HEADER.size) == header:
+                    return Image.frombytes("RGBA", dimensions, cached.read())
+        except (OSError, ValueError):
+            pass  # Absente, illisible ou tronquée: on la refait
+
+        img = process(file, dimensions)
+        try:
+            os.makedirs(AssetCache.directory, exist_ok=True)
+            # Propre au fil: le préchargement et Tk peuvent écrire la
+            # même image en même temps
+            temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporary, "wb") as output:
+                output.write(header)
+                output.write(img.tobytes())
+            os.replace(temporary, path)
+        except OSError:
+            pass  # Le cache est facultatif
+        return img
+
+    @staticmethod
+    def clear() -> None:
+        """Supprime toutes les entrées du cache."""
+        if not os.path.isdir(AssetCache.directory):
+            return
+        for name in os.listdir(AssetCache.directory):
+            if name.endswith(".rgba"):
+                os.remove(os.path.join(AssetCache.directory, name))
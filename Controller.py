@@ -22,6 +22,8 @@
 Contient :
     - Controlleur principal
     - Controlleur du jeu
+    - Controlleur du jeu sans fenêtre
+    - Controlleur de la mesure de charge
     - Controlleur du menu des options
     - Controlleur du menu des highscores
     - Controlleur du menu de l'arsenal
@@ -31,25 +33,38 @@ Contient :
 from __future__ import annotations
 
 # Importation des modules standards
-import random
+import csv
+import math
+import os
+import statistics
+import struct
+import time
+from typing import NamedTuple
 import tkinter as tk
 from abc import ABC  # Classe abstraite
 
 from Highscore import HighScore
+from Replay import Replay, Event
+from Snapshot import SpawnState
+from Profiler import profiler
 from Container import BetterFrame
 from View import (
     View,
     MenuView,
     GameView,
+    NullGameView,
+    SpritePrewarmer,
     HighscoreView,
     OptionsView,
     ArsenalView,
     GameOverView
 )
 from Model import GameModel, Difficulty
-from Objects.Position import Point  # type: ignore
+from Objects.Position import Point, Dimension2D  # type: ignore
 from Objects.Alien import Alien, ALIENTYPES  # type: ignore
-from Objects.Modifiers import Experience
+from Objects.Asteroid import Asteroid  # type: ignore
+from Objects.Bullet import Bullet  # type: ignore
+from Objects.Modifiers import Experience, Modifiers  # type: ignore
 
 class Controller(ABC):
     """Classe abstraite des controlleurs
@@ -124,6 +139,14 @@ class MenuController(Controller):
 
         super().start()
 
+        # Prépare les autres écrans pendant que le menu est affiché
+        SpritePrewarmer(self.root, [
+            *GameView.assets(),
+            *HighscoreView.assets(),
+            *OptionsView.assets(),
+            *GameOverView.assets(),
+        ]).start()
+
 
 class GameController(Controller):
     """Controlleur du jeu
@@ -132,24 +155,88 @@ class GameController(Controller):
     :param self.root: Fenêtre principale du jeu
     :param self.main_frame: Frame graphique principale du jeu.
     :param self.view: Vue associée au controlleur
+
+    La simulation avance par pas fixes de `tick_length` secondes,
+    peu importe le temps que prend l'affichage: chaque image effectue
+    autant de pas que le temps écoulé le demande (au plus `max_steps`),
+    puis dessine une seule fois.
     """
+    tick_length = 0.016
+    """Durée simulée d'un tick, en secondes"""
+    max_steps = 5
+    """Nombre maximal de ticks par image. Au-delà, le retard est oublié
+    pour éviter que la simulation ne rattrape jamais l'affichage."""
+
     def __init__(self, root: tk.Tk):
         super().__init__(root)
-        self.eventPos = (1, 1)
         self.view: GameView = GameView(self.main_frame)
-        self.game = GameModel(Difficulty.NORMAL)
-        self.game.player.id = self.view.spawnPlayer(590, 750)
+        self.setup_game()
         self.bind_mouse_pregame()
+
+    def setup_game(
+            self, seed: int | None = None, game: GameModel | None = None,
+            spawn: SpawnState | None = None,
+            difficulty: Difficulty = Difficulty.NORMAL
+    ):
+        """Création de la partie et des compteurs d'apparition
+
+        :param seed: Graine de la partie, aléatoire par défaut
+        :param difficulty: Difficulté de la nouvelle partie
+        :param game: Partie à reprendre (voir `Snapshot`), au lieu d'en
+            créer une nouvelle. Aucun tirage n'est fait dans `game.rng`,
+            pour que la suite de la partie reste la même.
+        :param spawn: État du controlleur sauvegardé avec `game`. Sans
+            lui, les compteurs d'apparition repartent de leur maximum.
+        """
+        self.eventPos = (1, 1)
+        self.game = game if game is not None else GameModel(
+                difficulty,
+                Dimension2D(
+                    self.view.background_width, self.view.background_height
+                ),
+                seed=seed
+        )
+        self.game.player.id = self.view.spawnPlayer(*self.game.player.coords)
+        if game is not None:
+            self.spawn_sprites()
         self._enemy_spawn = True
+        self.ticks = 0
+        """Nombre de ticks effectués"""
+        self.replay = Replay(
+            self.game.seed, list(Difficulty).index(self.game.difficulty)
+        )
+        """Entrées du joueur, enregistrées pour rejouer la partie"""
 
         self.ennemy_spawn_timer_max = 50
         self.asteroid_spawn_timer_max = 120
-
-        self.ennemy_spawn_timer = random.randint(
-                0, self.ennemy_spawn_timer_max
-        )
-        self.asteroid_spawn_timer = random.randint(
-                0, self.asteroid_spawn_timer_max
+        self.alien_fire_chance = 0.25
+        """Probabilité qu'un alien tire, à chaque tick"""
+        self.modifier_chance = 0.005
+        self.experience_chance = 0.02
+
+        if game is None:
+            self.ennemy_spawn_timer = self.game.rng.randint(
+                    0, self.ennemy_spawn_timer_max
+            )
+            self.asteroid_spawn_timer = self.game.rng.randint(
+                    0, self.asteroid_spawn_timer_max
+            )
+        elif spawn is None:
+            self.ennemy_spawn_timer = self.ennemy_spawn_timer_max
+            self.asteroid_spawn_timer = self.asteroid_spawn_timer_max
+        else:
+            self.ennemy_spawn_timer = spawn.ennemy_spawn_timer
+            self.asteroid_spawn_timer = spawn.asteroid_spawn_timer
+            self._enemy_spawn = spawn.enemy_spawn
+            self.eventPos = (spawn.cursor_x, spawn.cursor_y)
+
+    def spawn_state(self) -> SpawnState:
+        """Retourne l'état du controlleur à sauvegarder avec la partie
+        (voir `Snapshot.save`).
+        """
+        return SpawnState(
+            self.ennemy_spawn_timer, self.asteroid_spawn_timer,
+            self._enemy_spawn, *self.eventPos
         )
 
     def start(self):
@@ -168,21 +255,63 @@ class GameController(Controller):
         self.view.canvas.bind("<Motion>", self.mouse_listener_move)
         self.view.canvas.bind("<Button-1>", self.mouse_listener_left_click)
         self.view.canvas.bind("<Button-3>", self.debug_mouse_listener)
+        self._last_frame = time.perf_counter()
+        self._lag = self.tick_length  # Premier tick immédiat
         self.tick()
 
     def mouse_listener_move(self, event):
-        """Déplacement du carré"""
-        self.eventPos = (event.x, event.y)
+        self.move_cursor(event.x, event.y)
 
     def mouse_listener_left_click(self, event):
+        self.fire()
+
+    def debug_mouse_listener(self, *_):
+        self.toggle_spawn()
+
+    def spawn_sprites(self):
+        """Affiche les sprites d'une partie reprise, sauf le joueur"""
+        player = self.game.player
+        for obj in self.game.sprites:
+            if obj is player:
+                continue
+            if isinstance(obj, Asteroid):
+                obj.id = self.view.spawnAsteroid(*obj.position)
+            elif isinstance(obj, Alien):
+                # L'apparence n'est pas sauvegardée. La tirer dans
+                # `game.rng` changerait la suite de la partie reprise.
+                obj.id = self.view.spawnAlien(ALIENTYPES[0], *obj.position)
+            elif isinstance(obj, Bullet) and obj.side == player.side:
+                obj.id = self.view.spawnBullet(*obj.position)
+            elif isinstance(obj, Bullet):
+                obj.id = self.view.spawnBulletAlien(*obj.center)
+            elif isinstance(obj, Modifiers):
+                obj.id = self.view.spawnModifier(obj)
+
+    def move_cursor(self, x: int, y: int):
+        """Déplacement du carré"""
+        self.replay.record(self.ticks, Replay.MOVE, x, y)
+        self.eventPos = (x, y)
+
+    def fire(self):
         """Création d'un projectile"""
+        self.replay.record(self.ticks, Replay.CLICK)
         bullet = self.game.shoot(self.game.player)
         bullet.id = self.view.spawnBullet(*bullet.position)
 
-    def debug_mouse_listener(self, *_):
+    def toggle_spawn(self):
         """Toggle les nouveaux objets"""
+        self.replay.record(self.ticks, Replay.TOGGLE_SPAWN)
         self._enemy_spawn = not self._enemy_spawn
 
+    def apply(self, event: Event):
+        """Applique une entrée enregistrée dans un `Replay`"""
+        if event.kind == Replay.MOVE:
+            self.move_cursor(event.x, event.y)
+        elif event.kind == Replay.CLICK:
+            self.fire()
+        elif event.kind == Replay.TOGGLE_SPAWN:
+            self.toggle_spawn()
+
     def player_movement(self):
         """Déplacement du joueur"""
         destination = Point(*self.eventPos)
@@ -191,16 +320,69 @@ class GameController(Controller):
         destination.y -= player.dimension.height / 2
         player.move_to(destination)
         self.game.player.update()
-        self.view.canvas.moveto(self.game.player.id, *player.position)
 
     def tick(self):
-        """Méthode appelée à chaque tick du jeu"""
-        width = self.view.dimension.width
+        """Méthode appelée à chaque image du jeu"""
+        now = time.perf_counter()
+        self._lag += now - self._last_frame
+        self._last_frame = now
+
+        steps = 0
+        while self._lag >= self.tick_length and self.game.player.alive():
+            if steps == self.max_steps:
+                self._lag = 0
+                break
+            self.step()
+            self._lag -= self.tick_length
+            steps += 1
+
+        if steps:  # Sinon, rien n'a changé depuis la dernière image
+            self.render()
+        elapsed = time.perf_counter() - now
+        if profiler.enabled:
+            profiler.record("tick", elapsed)
+
+        if self.game.player.alive():
+            # Le temps passé dans cette image compte déjà pour la suivante,
+            # et arrondir vers le haut évite une image sans tick
+            delay = (self.tick_length - self._lag - elapsed) * 1000
+            self.view.canvas.after(max(1, math.ceil(delay)), self.tick)
+        else:
+            try:
+                self.replay.save()
+            except (OSError, struct.error):  # Partie simplement perdue
+                pass
+            self.change_controller(GameOverController)
+            print(f"Your score: {self.game.score}")
+            self.root.controller.score =self.game.score
+            self.root.controller.show_score()
+
+    def step(self):
+        """Avance la partie d'un tick, sans planifier le suivant"""
+        profiler.start()
+        self.spawn()
+        profiler.lap("spawn")
+
+        # Effectue le mouvement du joueur
+        self.player_movement()
+        profiler.lap("player_movement")
+
+        # Déplace tous les objets et les retire s'ils sont hors de l'écran
+        for trash in self.game.update():
+            self.view.deleteSprite(trash.id)
+        profiler.lap("deletion")
+
+        self.ticks += 1
+        self.replay.ticks = self.ticks
+
+    def spawn(self):
+        """Apparition des ennemis, de leurs tirs et des bonus"""
+        width = self.game.dimension.width
         if self._enemy_spawn:
             if self.asteroid_spawn_timer == 0:
                 asteroid = self.game.spawn_asteroid(width)
                 asteroid.id = self.view.spawnAsteroid(*asteroid.position)
-                self.asteroid_spawn_timer = random.randint(
+                self.asteroid_spawn_timer = self.game.rng.randint(
                         0, self.asteroid_spawn_timer_max
                 )
             else:
@@ -209,53 +391,234 @@ class GameController(Controller):
             if self.ennemy_spawn_timer == 0:
                 alien = self.game.spawn_alien(width)
                 alien.id = self.view.spawnAlien(
-                        random.choice(ALIENTYPES), *alien.position
+                        self.game.rng.choice(ALIENTYPES), *alien.position
                 )
-                self.ennemy_spawn_timer = random.randint(
+                self.ennemy_spawn_timer = self.game.rng.randint(
                         0, self.ennemy_spawn_timer_max
                 )
             else:
                 self.ennemy_spawn_timer -= 1
             
-            if random.random() < 0.25 and self.game.get_all_of(Alien):
+            if (
+                    self.game.rng.random() < self.alien_fire_chance
+                    and self.game.get_all_of(Alien)
+            ):
                 bullet = self.game.shoot(Alien)
                 bullet.id = self.view.spawnBulletAlien(*bullet.center)
             
-            if random.random() < 0.005:
+            if self.game.rng.random() < self.modifier_chance:
                 mod = self.game.spawn_modifier(width)
                 mod.id = self.view.spawnModifier(mod)
         
-        if random.random() < 0.02:
+        if self.game.rng.random() < self.experience_chance:
             exp = self.game.spawn_experience(width)
             exp.id = self.view.spawnModifier(exp)
 
-        # Effectue le mouvement du joueur
-        self.player_movement()
+    def render(self):
+        """Affiche l'état actuel de la partie"""
+        profiler.start()
+        self.view.update_info(self.game.score, self.game.player.health)
+        profiler.lap("update_info")
 
-        # Déplace tous les objets et les retire s'ils sont hors de l'écran
+        for obj in self.game.sprites:
+            self.view.moveSprite(obj.id, *obj.position)
+        profiler.lap("move_sprites")
+        self.view.flush()
+        profiler.lap("flush")
 
-        killcond = lambda obj: (
-                not self.view.isVisible(obj.id)
-                and obj.position.y > obj.dimension.height
-                and obj.__class__ is not Experience
-        )
 
-        self.view.update_info(self.game.score, self.game.player.health)
+class HeadlessGameController(GameController):
+    """Controlleur du jeu sans fenêtre, qui avance la partie aussi vite
+    que possible. Sert aux tests d'endurance et à mesurer le débit du
+    modèle sans le coût de Tk.
 
-        for trash in self.game.update(kill_if=killcond):
-            self.view.deleteSprite(trash.id)
+    :argument seed: Graine de la partie, aléatoire par défaut
+    :argument game: Partie à reprendre, par exemple une partie chargée
+        avec `Snapshot.load`
+    :argument spawn: État du controlleur chargé avec `game`
+    :argument difficulty: Difficulté de la partie, si elle est nouvelle
 
-        for obj in self.game.sprites:
-            self.view.moveSprite(obj.id, *obj.position)
+    :param self.view: Vue nulle qui ne dessine rien
+    :param self.ticks: Nombre de ticks effectués
+    """
+    def __init__(
+            self, seed: int | None = None, game: GameModel | None = None,
+            spawn: SpawnState | None = None,
+            difficulty: Difficulty = Difficulty.NORMAL
+    ):
+        # Pas de fenêtre, donc pas de Controller.__init__
+        self.root = None
+        self.view = NullGameView()
+        self.setup_game(seed, game, spawn, difficulty)
+
+    def run(self, ticks: int, stop_on_death: bool = True) -> float:
+        """Effectue jusqu'à `ticks` ticks et retourne le nombre de ticks
+        par seconde atteint.
+
+        :param ticks: Nombre de ticks à effectuer
+        :param stop_on_death: Arrête la partie quand le joueur meurt
+        """
+        start = time.perf_counter()
+        done = 0
+        while done < ticks:
+            self.step()
+            done += 1
+            if stop_on_death and not self.game.player.alive():
+                break
+        elapsed = time.perf_counter() - start
+        return done / elapsed if elapsed else float("inf")
+
+    def play(self, replay: Replay) -> float:
+        """Rejoue les entrées d'une partie enregistrée aussi vite que
+        possible et retourne le nombre de ticks par seconde atteint.
+        Le controlleur doit avoir été créé avec la graine et la
+        difficulté de `replay`.
+        """
+        difficulty = list(Difficulty).index(self.game.difficulty)
+        if (
+            replay.seed != self.game.seed
+            or replay.difficulty != difficulty
+            or self.ticks
+        ):
+            raise ValueError(
+                "The game must be new and use the replay seed and difficulty."
+            )
+        start = time.perf_counter()
+        for _, events in replay.by_tick():
+            for event in events:
+                self.apply(event)
+            self.step()
+        elapsed = time.perf_counter() - start
+        return replay.ticks / elapsed if elapsed else float("inf")
+
+class StressSample(NamedTuple):
+    """Durée d'un tick de `StressGameController` et nombre d'objets de
+    chaque type présents à la fin du tick.
+    """
+    tick: int
+    seconds: float
+    aliens: int
+    asteroids: int
+    bullets: int
+    orbs: int
 
-        if self.game.player.alive():
-            self.view.canvas.after(16, self.tick)
+
+class StressGameController(HeadlessGameController):
+    """Controlleur qui augmente peu à peu les taux d'apparition et de
+    tir, avec un joueur invincible, pour trouver le nombre d'objets à
+    partir duquel un tick ne tient plus dans une image.
+
+    :argument seed: Graine de la partie, aléatoire par défaut
+    :argument root: Fenêtre où dessiner la partie. Sans fenêtre, le
+        rendu passe par la vue nulle et seul son coût en Python est
+        mesuré.
+
+    :param self.samples: Mesure de chaque tick effectué par `stress`
+    """
+    budget = 0.016
+    """Durée maximale d'un tick, en secondes (une image à 60 Hz)"""
+    ramp_every = 60
+    """Nombre de ticks entre deux augmentations des taux"""
+
+    def __init__(self, seed: int | None = None, root: tk.Tk | None = None):
+        if root is None:
+            super().__init__(seed)
         else:
-            self.change_controller(GameOverController)
-            print(f"Your score: {self.game.score}")
-            self.root.controller.score =self.game.score
-            self.root.controller.show_score()
-            
+            Controller.__init__(self, root)
+            self.view = GameView(self.main_frame)
+            self.view.draw()
+            self.setup_game(seed)
+        self.spawn_batch = 1
+        """Nombre d'appels à `GameController.spawn` par tick"""
+        self.samples: list[StressSample] = []
+
+    def spawn(self):
+        for _ in range(self.spawn_batch):
+            super().spawn()
+
+    def ramp(self):
+        """Augmente d'un cran les apparitions, les tirs des aliens et
+        les orbes d'expérience. Une fois les apparitions à chaque tick
+        atteintes, `spawn_batch` augmente.
+        """
+        if self.ennemy_spawn_timer_max == self.asteroid_spawn_timer_max == 0:
+            self.spawn_batch += 1
+        self.ennemy_spawn_timer_max = int(self.ennemy_spawn_timer_max * 0.8)
+        self.asteroid_spawn_timer_max = int(
+                self.asteroid_spawn_timer_max * 0.8
+        )
+        # Les compteurs en cours ne doivent pas retarder le nouveau taux
+        self.ennemy_spawn_timer = min(
+                self.ennemy_spawn_timer, self.ennemy_spawn_timer_max
+        )
+        self.asteroid_spawn_timer = min(
+                self.asteroid_spawn_timer, self.asteroid_spawn_timer_max
+        )
+        self.alien_fire_chance = min(1.0, self.alien_fire_chance + 0.05)
+        self.experience_chance = min(1.0, self.experience_chance * 1.25)
+
+    def stress(self, ticks: int, render: bool = False) -> StressSample | None:
+        """Effectue jusqu'à `ticks` ticks en appelant `ramp` tous les
+        `ramp_every` ticks, et s'arrête une fois la saturation atteinte.
+
+        :param render: Mesure aussi `render` (et le dessin de la
+            fenêtre, s'il y en a une)
+        :return: Le point de saturation (voir `saturation`)
+        """
+        self.samples.clear()
+        self.game.invulnerable = True
+        sprites = self.game.sprites
+        for tick in range(ticks):
+            if tick and tick % self.ramp_every == 0:
+                if self.saturation() is not None:
+                    break
+                self.ramp()
+            start = time.perf_counter()
+            self.step()
+            if render:
+                self.render()
+                if self.root is not None:
+                    self.root.update()
+            seconds = time.perf_counter() - start
+            self.samples.append(StressSample(
+                tick, seconds,
+                *(
+                    len(sprites.get_all_of(cls))
+                    for cls in (Alien, Asteroid, Bullet, Experience)
+                )
+            ))
+        return self.saturation()
+
+    def saturation(self) -> StressSample | None:
+        """Retourne la mesure médiane de la première série de
+        `ramp_every` ticks dont la durée médiane dépasse `budget`, ou
+        None si aucune ne la dépasse. La médiane ignore les pauses
+        isolées (ramasse-miettes, système).
+        """
+        for start in range(0, len(self.samples), self.ramp_every):
+            window = self.samples[start:start + self.ramp_every]
+            if len(window) < self.ramp_every:
+                break
+            median = statistics.median_low(sample.seconds for sample in window)
+            if median > self.budget:
+                return next(
+                    sample for sample in window if sample.seconds == median
+                )
+        return None
+
+    def dump(self, path: str) -> str:
+        """Écrit les mesures de `stress` dans un fichier CSV (durée en
+        ms) et retourne son chemin.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(("tick", "ms", *StressSample._fields[2:]))
+            for sample in self.samples:
+                writer.writerow(
+                    sample._replace(seconds=f"{sample.seconds * 1000:.4f}")
+                )
+        return path
 
 
 class ArsenalController(Controller):
@@ -288,7 +651,7 @@ class HighscoreController(Controller):
         self.view.main_canvas.tag_bind(self.view.menu_button, "<Button-1>",
                                        lambda event:
                                        self.change_controller(MenuController))
-        self.view.load_scores(HighScore.get_scores())
+        self.view.load_scores(HighScore.get_scores(limit=self.view.rows))
         # Saving score: Highscore.save_score(name, score)
         # Getting score: HighScore.get_scores()
 
@@ -306,17 +669,40 @@ class GameOverController(Controller):
         super().__init__(root)
         self.view = GameOverView(self.main_frame)
         self.score = 0
+        self.poll_delay = 20
+        """Délai entre les vérifications de l'écriture du score (ms)"""
         self.view.name_entry.bind("<Return>", self.on_submit)
         self.view.name_entry.focus_set()
 
     def show_score(self):
-        self.view.show_score(self.score)
+        self.view.show_score(
+            self.score,
+            HighScore.rank(self.score),
+            HighScore.percentile(self.score)
+        )
 
     def on_submit(self,_):
         self.name = self.view.name_entry.get() 
         if(self.name):
-            HighScore.save_score(self.name,self.score)
-        self.change_controller(HighscoreController)
+            self.view.name_entry.unbind("<Return>")
+            self.saving = HighScore.submit_score(self.name,self.score)
+            self.wait_for_save()
+        else:
+            self.change_controller(HighscoreController)
+
+    def wait_for_save(self):
+        """Passe aux highscores une fois le score écrit, sans bloquer
+        la fenêtre pendant l'écriture. Si l'écriture échoue, l'erreur
+        est affichée et le joueur peut réessayer."""
+        if not self.saving.done():
+            self.root.after(self.poll_delay, self.wait_for_save)
+        elif self.saving.exception() is not None:
+            self.view.show_error(
+                f"SCORE NOT SAVED: {self.saving.exception()}"
+            )
+            self.view.name_entry.bind("<Return>", self.on_submit)
+        else:
+            self.change_controller(HighscoreController)
 
 class OptionsController(Controller):
     """Controlleur des options
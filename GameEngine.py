@@ -25,12 +25,20 @@ la boucle principale du jeu.
 """
 #  Debugging
 import sys 
-import pstats
-import cProfile
 
+import argparse
+import os
+import random
 import tkinter as tk
 
-from Controller import MenuController
+from Controller import (
+    MenuController, HeadlessGameController, StressGameController
+)
+from Highscore import HighScore
+from Profiler import profiler
+from Model import Difficulty
+from Replay import Replay
+from Snapshot import Snapshot
 
 
 def debugger_is_active() -> bool:
@@ -48,6 +56,8 @@ class Root(tk.Tk):
     :param this.controller: Controlleur du menu
     :param this.resizable: Redimensionnement de la fenêtre
     :param this.geometry: Taille de la fenêtre
+
+    F3 active ou désactive le profileur de ticks (voir `profiler`).
     """
     def __init__(self):
         super().__init__()
@@ -55,6 +65,26 @@ class Root(tk.Tk):
         self.controller = MenuController(self)
         self.resizable(False, False)
         self.geometry("1200x800")
+        self.bind("<F3>", self.toggle_profiler)
+
+    def toggle_profiler(self, *_):
+        print(f"Tick profiler {'on' if profiler.toggle() else 'off'}")
+
+    def destroy(self):
+        """Ferme la fenêtre et la connexion aux highscores, et écrit
+        les mesures du profileur s'il y en a.
+        """
+        super().destroy()
+        HighScore.close()
+        dump_profile()
+
+
+def seed_type(value: str) -> int:
+    """Graine donnée en ligne de commande: un entier de 0 à 2**64 - 1."""
+    seed = int(value)
+    if not 0 <= seed < 2**64:
+        raise argparse.ArgumentTypeError(f"{value} is not in [0, 2**64)")
+    return seed
 
 
 def main() -> None:
@@ -64,11 +94,143 @@ def main() -> None:
     root.mainloop()
 
 
+def dump_profile() -> None:
+    """Affiche le résumé du profileur et l'écrit en CSV, s'il a mesuré
+    quelque chose.
+    """
+    if not profiler.phases():
+        return
+    print(profiler.report())
+    try:
+        print(f"Tick profile written to {profiler.dump()}")
+    except OSError as error:
+        print(f"Tick profile not written: {error}")
+
+
+def headless(
+        ticks: int, seed: int | None = None,
+        snapshot: str | None = None, save_snapshot: str | None = None
+) -> None:
+    """Fait tourner une partie sans fenêtre et affiche son débit.
+
+    :param snapshot: Sauvegarde à partir de laquelle commencer
+    :param save_snapshot: Fichier où sauvegarder la partie à la fin
+    """
+    game, spawn = Snapshot.load(snapshot) if snapshot else (None, None)
+    controller = HeadlessGameController(seed, game, spawn)
+    tps = controller.run(ticks, stop_on_death=False)
+    print(
+        f"{controller.ticks} ticks, {tps:.0f} ticks/s, "
+        f"{len(controller.game.sprites)} sprites, seed {controller.game.seed}"
+    )
+    if save_snapshot:
+        Snapshot.save(
+            controller.game, save_snapshot, controller.spawn_state()
+        )
+    dump_profile()
+
+
+def replay(path: str) -> None:
+    """Rejoue une partie enregistrée sans fenêtre et affiche son débit."""
+    recording = Replay.load(path)
+    controller = HeadlessGameController(
+        recording.seed, difficulty=list(Difficulty)[recording.difficulty]
+    )
+    tps = controller.play(recording)
+    print(
+        f"{controller.ticks} ticks, {tps:.0f} ticks/s, "
+        f"score {controller.game.score}"
+    )
+    dump_profile()
+
+
+def stress(ticks: int, seed: int | None = None) -> None:
+    """Augmente la charge jusqu'à ce qu'un tick dépasse le budget d'une
+    image, pour le modèle seul puis avec le rendu, et affiche le nombre
+    d'objets atteint. Les mesures sont écrites en CSV.
+    """
+    seed = random.getrandbits(32) if seed is None else seed
+    try:
+        root: tk.Tk | None = tk.Tk()
+        root.title("Starfighter - stress")
+        root.geometry("1200x800")
+    except tk.TclError:  # Pas d'écran: rendu par la vue nulle
+        root = None
+
+    budget = StressGameController.budget * 1000
+    print(f"Seed {seed}, budget {budget:.0f} ms per tick")
+    for name, render in (("model", False), ("model+render", True)):
+        controller = StressGameController(seed, root if render else None)
+        point = controller.stress(ticks, render)
+        path = controller.dump(os.path.join(
+            os.path.dirname(__file__), "Data", "profiles",
+            f"stress-{name.replace('+', '-')}.csv"
+        ))
+        if render and root is None:
+            name += " (no display)"
+        if point is None:
+            last = controller.samples[-1]
+            print(
+                f"{name}: not saturated after {last.tick + 1} ticks "
+                f"({last.aliens} aliens, {last.asteroids} asteroids, "
+                f"{last.bullets} bullets, {last.orbs} orbs)"
+            )
+        else:
+            print(
+                f"{name}: saturated at tick {point.tick} "
+                f"(median {point.seconds * 1000:.1f} ms) with "
+                f"{point.aliens} aliens, {point.asteroids} asteroids, "
+                f"{point.bullets} bullets, {point.orbs} orbs"
+            )
+        print(f"  samples written to {path}")
+    if root is not None:
+        root.destroy()
+
+
 if __name__ == "__main__":
-    if debugger_is_active():
-        with cProfile.Profile() as pr:
-            main()
-            stats = pstats.Stats(pr).sort_stats('tottime')
-            stats.print_stats(25)
+    parser = argparse.ArgumentParser(description="Starfighter")
+    parser.add_argument(
+        "--headless", type=int, metavar="TICKS",
+        help="Simule TICKS ticks sans fenêtre, aussi vite que possible"
+    )
+    parser.add_argument(
+        "--seed", type=seed_type,
+        help="Graine de la partie simulée par --headless ou --stress"
+    )
+    parser.add_argument(
+        "--replay", metavar="FILE",
+        help="Rejoue sans fenêtre une partie enregistrée "
+             "(par exemple Data/replays/last.sfr)"
+    )
+    parser.add_argument(
+        "--snapshot", metavar="FILE",
+        help="Commence --headless à partir d'une partie sauvegardée"
+    )
+    parser.add_argument(
+        "--save-snapshot", metavar="FILE",
+        help="Sauvegarde la partie à la fin de --headless"
+    )
+    parser.add_argument(
+        "--stress", type=int, metavar="TICKS",
+        help="Augmente la charge pendant au plus TICKS ticks et affiche "
+             "le nombre d'objets qui sature une image de 16 ms"
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="Mesure chaque phase des ticks dès le départ (F3 en jeu) et "
+             "écrit les mesures dans Data/profiles/ticks.csv à la fin"
+    )
+    args = parser.parse_args()
+    if args.profile or debugger_is_active():
+        profiler.toggle()
+
+    if args.replay:
+        replay(args.replay)
+    elif args.stress:
+        stress(args.stress, args.seed)
+    elif args.headless:
+        headless(
+            args.headless, args.seed, args.snapshot, args.save_snapshot
+        )
     else:
         main()
@@ -20,11 +20,19 @@
 """Permet d'enregistrer des scores à un fichier."""
 
 # Documentation
-from typing import Callable, Literal
+from __future__ import annotations
+from typing import Callable, Iterable, Iterator, Literal
 
 # Modules standard
 import sqlite3 as sql
+import csv
+import itertools
+import json
 import os
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
 from functools import partial
 
 
@@ -34,10 +42,35 @@ class HighScore:
     
     Ne possède que des méthodes statiques. Essayer de l'instancier
     causera une erreur.
+
+    Une seule connexion est ouverte, au premier accès, et réutilisée
+    par la suite: le schéma n'est créé qu'une fois et les requêtes
+    préparées restent dans le cache de la connexion. `HighScore.close`
+    la ferme à la fermeture du jeu.
+
+    Les scores sont écrits en arrière-plan par un fil d'exécution qui
+    insère en un seul `executemany` tous les scores en attente. Les
+    lectures attendent que les écritures en attente soient terminées:
+    un score enregistré apparaît toujours dans les lectures suivantes.
     Méthodes:
+        `HighScore.submit_score`: Enregistre un score en
+          arrière-plan.
         `HighScore.save_score`: Sauvegarde un score dans le fichier.
         `HighScore.get_scores`: Retourne une liste des scores
           enregistrés.
+        `HighScore.get_page`: Retourne une page de scores qui suit
+          la page précédente (pagination par clé).
+        `HighScore.rank`, `HighScore.percentile`: Situent un score
+          dans le classement.
+        `HighScore.personal_best`: Retourne le meilleur score d'un
+          joueur.
+        `HighScore.prune`: Supprime les vieux scores, sauf les
+          meilleurs.
+        `HighScore.compact`: Libère en arrière-plan l'espace des
+          scores supprimés.
+        `HighScore.export_scores`, `HighScore.import_scores`:
+          Transfèrent les scores vers ou depuis un fichier CSV ou JSONL.
+        `HighScore.close`: Ferme la connexion à la base de donnée.
     Note:
         Les autres méthodes sont à usage interne. Il n'est pas
         recommandé de les utiliser.
@@ -50,88 +83,605 @@ class HighScore:
     if not os.path.exists(os.path.dirname(database)):
         os.makedirs(os.path.dirname(database))
 
+    _connection: sql.Connection | None = None
+    """Connexion partagée, ouverte par `connect`"""
+    _writes: queue.Queue = queue.Queue()
+    """Scores en attente d'écriture, avec leur `Future`"""
+    _writer: threading.Thread | None = None
+    """Fil d'exécution qui écrit les scores, démarré au premier score"""
+    _writer_lock = threading.Lock()
+    _maintenance: ThreadPoolExecutor | None = None
+    """Fil d'exécution de `compact`, démarré au premier appel"""
+
+    FIELDS = ("UserName", "Score", "Date")
+    """Colonnes transférées par `export_scores` et `import_scores`"""
+    CHUNK = 1000
+    """Nombre de lignes par transaction des opérations de maintenance"""
+    FLUSH_TIMEOUT = 5.0
+    """Attente maximale de `flush` par défaut, en secondes"""
+
+    INSERT = "INSERT INTO HighScores (UserName, Score) VALUES (?, ?)"
+    DELETE = "DELETE FROM HighScores WHERE ID = ?"
+
+    ORDERS = {
+        "Score": "Score DESC, ID ASC",
+        "Date": "Date DESC, ID DESC",
+        "UserName": "UserName DESC, ID ASC",
+    }
+    """Ordres de tri acceptés. L'identifiant départage les égalités,
+    ce qui permet de reprendre le tri après n'importe quelle ligne."""
+    AFTER = {
+        "Score": ("Score = :value AND ID > :id", "Score < :value"),
+        "Date": ("Date = :value AND ID < :id", "Date < :value"),
+        "UserName": ("UserName = :value AND ID > :id", "UserName < :value"),
+    }
+    """Conditions des lignes qui suivent la ligne (value, id) dans
+    chaque ordre de `ORDERS`: celles à égalité, puis les autres. Deux
+    requêtes séparées permettent à SQLite de chercher le début de
+    chacune dans l'index."""
+
+    SCHEMA = (
+        """CREATE TABLE IF NOT EXISTS HighScores (
+            ID INTEGER PRIMARY KEY AUTOINCREMENT,
+            UserName TEXT,
+            Score INTEGER,
+            Date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )""",
+        """CREATE INDEX IF NOT EXISTS HighScoresByScore
+            ON HighScores (Score DESC, ID ASC)""",
+        """CREATE INDEX IF NOT EXISTS HighScoresByDate
+            ON HighScores (Date DESC, ID DESC)""",
+        """CREATE INDEX IF NOT EXISTS HighScoresByPlayer
+            ON HighScores (UserName, Score)""",
+        # Nombre de parties pour chaque score, pour `rank`
+        """CREATE TABLE IF NOT EXISTS ScoreCounts (
+            Score INTEGER PRIMARY KEY,
+            Count INTEGER NOT NULL
+        )""",
+        # Meilleur score de chaque joueur, pour `personal_best`
+        """CREATE TABLE IF NOT EXISTS PlayerBest (
+            UserName TEXT PRIMARY KEY,
+            Score INTEGER NOT NULL
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS HighScoresInsertCount
+            AFTER INSERT ON HighScores
+        BEGIN
+            INSERT INTO ScoreCounts (Score, Count) VALUES (new.Score, 1)
+                ON CONFLICT (Score) DO UPDATE SET Count = Count + 1;
+        END""",
+        # Comme `BACKFILL`, les scores sans nom n'ont pas de meilleur score
+        """CREATE TRIGGER IF NOT EXISTS HighScoresInsertPlayer
+            AFTER INSERT ON HighScores
+            WHEN new.UserName IS NOT NULL
+        BEGIN
+            INSERT INTO PlayerBest (UserName, Score)
+                VALUES (new.UserName, new.Score)
+                ON CONFLICT (UserName)
+                DO UPDATE SET Score = max(Score, excluded.Score);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS HighScoresDelete
+            AFTER DELETE ON HighScores
+        BEGIN
+            UPDATE ScoreCounts SET Count = Count - 1
+                WHERE Score = old.Score;
+            DELETE FROM ScoreCounts WHERE Score = old.Score AND Count = 0;
+            DELETE FROM PlayerBest WHERE UserName = old.UserName
+                AND NOT EXISTS (
+                    SELECT 1 FROM HighScores WHERE UserName = old.UserName
+                );
+            UPDATE PlayerBest SET Score = (
+                SELECT MAX(Score) FROM HighScores
+                    WHERE UserName = old.UserName
+            ) WHERE UserName = old.UserName AND Score = old.Score;
+        END""",
+    )
+    """Schéma de la base de donnée, créé par `create_db`"""
+    BACKFILL = (
+        """INSERT INTO ScoreCounts (Score, Count)
+            SELECT Score, COUNT(*) FROM HighScores GROUP BY Score""",
+        """INSERT INTO PlayerBest (UserName, Score)
+            SELECT UserName, MAX(Score) FROM HighScores
+                WHERE UserName IS NOT NULL GROUP BY UserName""",
+    )
+    """Remplit les tables de `SCHEMA` dérivées de HighScores"""
+
     def __init__(self):
         """Méthode explicitement interdite."""
         raise RuntimeError("This class cannot be instantiated.")
 
     @staticmethod
     def connect() -> sql.Connection:
-        """Alias sémantique de create_db. Utiliser cette méthode est
-        préférable puisque son effet voulu est plus clair.
+        """Retourne la connexion à la base de donnée. Elle est créée
+        (voir `create_db`) au premier appel, puis réutilisée.
         
         Returns:
             Une connection à la base de donnée qui peut être utilisée
               pour y exécuter des commandes.
         """
-        return HighScore.create_db()
+        if HighScore._connection is None:
+            HighScore._connection = HighScore.create_db()
+        return HighScore._connection
 
     @staticmethod
     def create_db() -> sql.Connection:
-        """Crée le schema si il n'est pas présent dans le fichier.
+        """Ouvre une nouvelle connexion en mode WAL et crée le schema
+        si il n'est pas présent dans le fichier.
         
         Returns:
             Une connection à la base de donnée qui peut être utilisée
               pour y exécuter des commandes.
         """
         con = sql.connect(HighScore.database)
+        # Sans effet si le fichier contient déjà des tables (voir `compact`)
+        con.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        # Les lectures ne sont plus bloquées par une écriture en cours
+        con.execute("PRAGMA journal_mode=WAL")
+        con.execute("PRAGMA synchronous=NORMAL")
 
-        con.execute(f"""
-            CREATE TABLE IF NOT EXISTS HighScores (
-                ID INTEGER PRIMARY KEY AUTOINCREMENT,
-                UserName TEXT,
-                Score INTEGER,
-                Date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )"""
-        )
+        con.execute("BEGIN IMMEDIATE")  # Une connexion à la fois
+        summaries = con.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'ScoreCounts'"
+        ).fetchone()
+        for statement in HighScore.SCHEMA:
+            con.execute(statement)
+        if summaries is None:  # Scores enregistrés avant leur création
+            for statement in HighScore.BACKFILL:
+                con.execute(statement)
         con.commit()
 
         return con
 
+    @staticmethod
+    def close() -> None:
+        """Ferme la connexion partagée, si elle est ouverte. Elle sera
+        rouverte au prochain accès.
+        """
+        with HighScore._writer_lock:
+            writer, HighScore._writer = HighScore._writer, None
+            if writer is not None:
+                HighScore._writes.put(None)  # Termine après les écritures
+        if writer is not None:
+            writer.join()  # Hors du verrou, voir `_abandon`
+        if HighScore._maintenance is not None:
+            HighScore._maintenance.shutdown()
+            HighScore._maintenance = None
+        if HighScore._connection is not None:
+            HighScore._connection.close()
+            HighScore._connection = None
+
+    @staticmethod
+    def submit_score(name: str, score: int) -> Future:
+        """Enregistre un score dans la base de donnée en arrière-plan.
+        Args:
+            name: Le nom du joueur à utiliser pour la ligne.
+            score: Le nombre de points obtenus par le joueur.
+        Returns:
+            Un `Future` terminé lorsque le score est écrit. Il contient
+              l'erreur de SQLite si l'écriture a échoué.
+        """
+        future: Future = Future()
+        with HighScore._writer_lock:
+            if HighScore._writer is None:
+                HighScore._writer = threading.Thread(
+                    target=HighScore._write_behind,
+                    name="HighScoreWriter",
+                    daemon=True
+                )
+                HighScore._writer.start()
+            HighScore._writes.put((name, score, future))
+        return future
+
     @staticmethod
     def save_score(name: str, score: int) -> None:
-        """Enregistre un score dans la base de donnée.
+        """Enregistre un score dans la base de donnée et attend la fin
+        de l'écriture.
         Args:
             name: Le nom du joueur à utiliser pour la ligne.
             score: Le nombre de points obtenus par le joueur.
         """
-        con = HighScore.connect()
-        con.cursor().execute(f"""
-            INSERT INTO HighScores (UserName, Score)
-                VALUES (?, ?) 
-            """, (name, score)
-        )
+        HighScore.submit_score(name, score).result()
 
-        con.commit()
-        con.close()
+    @staticmethod
+    def flush(timeout: float | None = FLUSH_TIMEOUT) -> bool:
+        """Attend que tous les scores soumis soient écrits.
+        Args:
+            timeout: Attente maximale, en secondes. None attend
+              indéfiniment.
+        Returns:
+            Faux si des scores sont encore en attente après `timeout`.
+        """
+        writes = HighScore._writes
+        with writes.all_tasks_done:
+            return writes.all_tasks_done.wait_for(
+                lambda: not writes.unfinished_tasks, timeout
+            )
 
+    @staticmethod
+    def _write_behind() -> None:
+        """Boucle du fil d'écriture. Chaque lot contient tous les scores
+        en attente, jusqu'à la demande d'arrêt (None).
+
+        Si le fil échoue (base impossible à ouvrir, erreur inattendue),
+        tous les scores en attente reçoivent l'erreur et le prochain
+        score soumis démarre un nouveau fil.
+        """
+        con = None
+        batch: list = []
+        try:
+            con = HighScore.create_db()  # Une connexion par fil d'exécution
+            stop = False
+            while not stop:
+                batch = [HighScore._writes.get()]
+                while batch[-1] is not None:
+                    try:
+                        batch.append(HighScore._writes.get_nowait())
+                    except queue.Empty:
+                        break
+                stop = batch[-1] is None
+                writes = batch[:-1] if stop else batch
+                if writes:
+                    try:
+                        with con:
+                            con.executemany(
+                                HighScore.INSERT,
+                                [(name, score) for name, score, _ in writes]
+                            )
+                    except sql.Error as error:
+                        for *_, future in writes:
+                            future.set_exception(error)
+                    else:
+                        for *_, future in writes:
+                            future.set_result(None)
+                for _ in batch:
+                    HighScore._writes.task_done()
+                batch = []
+        except BaseException as error:
+            HighScore._abandon(batch, error)
+        finally:
+            if con is not None:
+                con.close()
+
+    @staticmethod
+    def _abandon(batch: list, error: BaseException) -> None:
+        """Termine le fil d'écriture après une erreur: le lot en cours
+        et tous les scores en attente échouent avec `error`.
+        """
+        with HighScore._writer_lock:  # Aucun score ajouté entre-temps
+            if HighScore._writer is threading.current_thread():
+                HighScore._writer = None
+            while True:
+                try:
+                    batch.append(HighScore._writes.get_nowait())
+                except queue.Empty:
+                    break
+            for item in batch:
+                if item is not None and not item[2].done():
+                    item[2].set_exception(error)
+                HighScore._writes.task_done()
 
     @staticmethod
     def get_scores(
-            order: Literal["Score", "Date", "UserName"] = "Score"
+            order: Literal["Score", "Date", "UserName"] = "Score",
+            limit: int | None = None,
+            offset: int = 0
     ) -> list[tuple[tuple[str, int], Callable[[], None]]]:
         """Retourne une liste de tuples contenant les scores (nom et
         points) ainsi qu'une fonction qui supprime le score.
         Args:
             order: Colonne à utiliser pour l'ordre des scores. Par
               défaut, les scores les plus hauts sont en premier.
+            limit: Nombre maximal de scores à retourner. Par défaut,
+              tous les scores sont retournés.
+            offset: Nombre de scores à sauter au début.
         """
-        con = HighScore.connect()
-        cur = con.cursor()
-
-        # SQL Injection potential, but ? template didn't work
-        exc = cur.execute(
-            f"SELECT * FROM HighScores ORDER BY {order} DESC"
+        rows = HighScore._select(
+            order, "", {"limit": -1 if limit is None else limit,
+                        "offset": offset}
         )
+        return [HighScore._entry(row) for row in rows]
+
+    @staticmethod
+    def get_page(
+            order: Literal["Score", "Date", "UserName"] = "Score",
+            limit: int = 9,
+            after: tuple | None = None
+    ) -> tuple[list[tuple[tuple[str, int], Callable[[], None]]],
+               tuple | None]:
+        """Retourne une page de scores, comme `get_scores`. Contrairement
+        à `offset`, le coût ne dépend pas de la position de la page.
+        Args:
+            order: Colonne à utiliser pour l'ordre des scores.
+            limit: Nombre maximal de scores dans la page.
+            after: Clé retournée avec la page précédente, ou None pour
+              la première page.
+        Returns:
+            Les scores de la page et la clé de la page suivante, ou
+              None s'il n'y en a pas.
+        """
+        params = {"limit": limit, "offset": 0}
+        if after is None:
+            rows = HighScore._select(order, "", params)
+        else:
+            params["value"], params["id"] = after
+            ties, rest = HighScore.AFTER[order]
+            rows = HighScore._select(order, f"WHERE {ties}", params)
+            if len(rows) < limit:
+                params["limit"] = limit - len(rows)
+                rows += HighScore._select(order, f"WHERE {rest}", params)
+        key = None
+        if len(rows) == limit:
+            key = (rows[-1][order], rows[-1]["ID"])
+        return [HighScore._entry(row) for row in rows], key
+
+    @staticmethod
+    def rank(score: int) -> int:
+        """Retourne la position qu'aurait `score` dans le classement
+        (1 pour le meilleur). Les scores égaux ont la même position.
+
+        Ne compte que les scores différents, dans `ScoreCounts`, plutôt
+        que toutes les parties.
+        """
+        HighScore.flush()
+        above, = HighScore.connect().execute(
+            "SELECT COALESCE(SUM(Count), 0) FROM ScoreCounts WHERE Score > ?",
+            (score,)
+        ).fetchone()
+        return above + 1
+
+    @staticmethod
+    def percentile(score: int) -> float:
+        """Retourne le pourcentage des parties enregistrées dont le
+        score est plus bas que `score` (100 s'il n'y en a aucune).
+        """
+        HighScore.flush()
+        below, total = HighScore.connect().execute(
+            """SELECT COALESCE(SUM(CASE WHEN Score < ? THEN Count END), 0),
+                      COALESCE(SUM(Count), 0)
+                FROM ScoreCounts""",
+            (score,)
+        ).fetchone()
+        return 100 * below / total if total else 100.0
+
+    @staticmethod
+    def personal_best(name: str) -> int | None:
+        """Retourne le meilleur score du joueur, ou None s'il n'en a
+        aucun.
+        """
+        HighScore.flush()
+        row = HighScore.connect().execute(
+            "SELECT Score FROM PlayerBest WHERE UserName = ?", (name,)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    @staticmethod
+    def prune(keep_top: int = 1000, keep_days: int = 30) -> int:
+        """Supprime les scores qui ne sont ni parmi les `keep_top`
+        meilleurs, ni enregistrés dans les `keep_days` derniers jours.
+
+        Les scores sont supprimés par lots de `CHUNK`, chacun dans sa
+        propre transaction.
+        Returns:
+            Le nombre de scores supprimés.
+        """
+        HighScore.flush()
+        deleted = 0
+        with closing(HighScore.create_db()) as con:
+            # Les meilleurs scores ne changent pas pendant la suppression
+            last = con.execute(
+                f"""SELECT Score, ID FROM HighScores
+                    ORDER BY {HighScore.ORDERS["Score"]}
+                    LIMIT 1 OFFSET ?""",
+                (max(keep_top - 1, 0),)
+            ).fetchone()
+            if keep_top == 0:
+                last = (float("inf"), 0)
+            elif last is None:  # Moins de keep_top scores
+                return 0
+            cutoff, = con.execute(
+                "SELECT datetime('now', ?)", (f"-{keep_days} days",)
+            ).fetchone()
+            params = {
+                "score": last[0],
+                "id": last[1],
+                "cutoff": cutoff,
+                "chunk": HighScore.CHUNK,
+            }
+            while True:
+                with con:
+                    # +Score: parcourir l'index des dates, pas des scores
+                    count = con.execute(
+                        """DELETE FROM HighScores WHERE ID IN (
+                            SELECT ID FROM HighScores
+                            WHERE Date < :cutoff
+                            AND (+Score < :score
+                                 OR +Score = :score AND ID > :id)
+                            LIMIT :chunk
+                        )""",
+                        params
+                    ).rowcount
+                deleted += count
+                if count < HighScore.CHUNK:
+                    return deleted
+
+    @staticmethod
+    def compact(pages: int = 0) -> Future:
+        """Libère en arrière-plan les pages inutilisées du fichier
+        (`PRAGMA incremental_vacuum`).
+
+        Un fichier créé avant ce mode est d'abord converti par un
+        `VACUUM` complet, une seule fois.
+        Args:
+            pages: Nombre maximal de pages à libérer, 0 pour toutes.
+        Returns:
+            Un `Future` qui contient le nombre de pages libérées.
+        """
+        if HighScore._maintenance is None:
+            HighScore._maintenance = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="HighScoreMaintenance"
+            )
+        return HighScore._maintenance.submit(HighScore._vacuum, pages)
 
-        result = exc.fetchall()
-        # TODO: fancy zip() or itertools
-        return [
-            (
-                tuple(res[1:3]),
-                partial(HighScore.delete_score, res[0])
-            )  # type: ignore  # Je sais ce que je fais
-            for res in result
-        ]
+    @staticmethod
+    def _vacuum(pages: int) -> int:
+        """Tâche de `compact`."""
+        with closing(HighScore.create_db()) as con:
+            free, = con.execute("PRAGMA freelist_count").fetchone()
+            mode, = con.execute("PRAGMA auto_vacuum").fetchone()
+            if mode != 2:  # 2: INCREMENTAL
+                con.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                con.execute("VACUUM")
+                return free
+            # executescript exécute le pragma jusqu'au bout, une page par pas
+            con.executescript(f"PRAGMA incremental_vacuum({int(pages)});")
+            remaining, = con.execute("PRAGMA freelist_count").fetchone()
+            return free - remaining
+
+    @staticmethod
+    def export_scores(
+            path: str, format: Literal["csv", "jsonl"] | None = None
+    ) -> int:
+        """Écrit tous les scores dans un fichier, une ligne à la fois.
+        Args:
+            path: Fichier à créer.
+            format: "csv" ou "jsonl". Par défaut, selon l'extension de
+              `path`.
+        Returns:
+            Le nombre de scores écrits.
+        """
+        format = HighScore._format(path, format)
+        HighScore.flush()
+        count = 0
+        with closing(HighScore.create_db()) as con, \
+                open(path, "w", newline="", encoding="utf-8") as file:
+            rows = con.execute(
+                f"SELECT {', '.join(HighScore.FIELDS)} FROM HighScores "
+                "ORDER BY ID"
+            )
+            if format == "csv":
+                writer = csv.writer(file)
+                writer.writerow(HighScore.FIELDS)
+            for row in rows:
+                if format == "csv":
+                    writer.writerow(row)
+                else:
+                    file.write(json.dumps(dict(zip(HighScore.FIELDS, row))))
+                    file.write("\n")
+                count += 1
+        return count
+
+    @staticmethod
+    def import_scores(
+            path: str, format: Literal["csv", "jsonl"] | None = None
+    ) -> int:
+        """Ajoute les scores d'un fichier écrit par `export_scores`,
+        par exemple celui d'une autre borne. Les scores reçoivent de
+        nouveaux identifiants.
+
+        L'import se fait en une seule transaction: si une ligne est
+        invalide, aucun score n'est ajouté. Les dates sont normalisées
+        par `datetime()` de SQLite; une date absente ou vide prend la
+        date actuelle.
+        Args:
+            path: Fichier à lire.
+            format: "csv" ou "jsonl". Par défaut, selon l'extension de
+              `path`.
+        Returns:
+            Le nombre de scores ajoutés.
+        Raises:
+            ValueError: Si une ligne est invalide.
+        """
+        format = HighScore._format(path, format)
+        count = 0
+        with closing(HighScore.create_db()) as con, \
+                open(path, newline="", encoding="utf-8") as file:
+            rows: Iterable[dict]
+            if format == "csv":
+                rows = csv.DictReader(file)
+            else:
+                rows = (json.loads(line) for line in file if line.strip())
+            con.execute("BEGIN IMMEDIATE")
+            try:
+                last = con.execute(
+                    "SELECT COALESCE(MAX(ID), 0) FROM HighScores"
+                ).fetchone()[0]
+                for chunk in HighScore._chunks(
+                        HighScore._import_row(number, row)
+                        for number, row in enumerate(rows, 1)
+                ):
+                    con.executemany(
+                        "INSERT INTO HighScores (UserName, Score, Date) "
+                        "VALUES (?1, ?2, CASE WHEN ?3 IS NULL "
+                        "THEN CURRENT_TIMESTAMP ELSE datetime(?3) END)",
+                        chunk
+                    )
+                    count += len(chunk)
+                invalid = con.execute(
+                    "SELECT ID - ? FROM HighScores "
+                    "WHERE ID > ? AND Date IS NULL LIMIT 1",
+                    (last, last)
+                ).fetchone()
+                if invalid is not None:
+                    raise ValueError(f"Row {invalid[0]}: invalid Date")
+            except BaseException:
+                con.rollback()
+                raise
+            con.commit()
+        return count
+
+    @staticmethod
+    def _import_row(number: int, row: dict) -> tuple:
+        """Retourne les valeurs à insérer pour une ligne importée."""
+        try:
+            date = row.get("Date")
+            return (
+                row["UserName"], int(row["Score"]),
+                None if date in (None, "") else str(date)
+            )
+        except (KeyError, TypeError, ValueError, AttributeError) as error:
+            raise ValueError(f"Row {number}: {error!r}") from error
+
+    @staticmethod
+    def _format(path: str, format: str | None) -> str:
+        """Retourne le format d'échange à utiliser pour `path`."""
+        if format is None:
+            format = os.path.splitext(path)[1].lstrip(".").lower()
+        if format not in ("csv", "jsonl"):
+            raise ValueError(f"Unknown format: {format!r}")
+        return format
+
+    @staticmethod
+    def _chunks(rows: Iterable[tuple]) -> Iterator[list[tuple]]:
+        """Découpe `rows` en listes d'au plus `CHUNK` lignes."""
+        rows = iter(rows)
+        while chunk := list(itertools.islice(rows, HighScore.CHUNK)):
+            yield chunk
+
+    @staticmethod
+    def _select(order: str, where: str, params: dict) -> list[sql.Row]:
+        """Exécute une requête de scores triés selon `order`, qui doit
+        être une clé de `ORDERS`.
+        """
+        if order not in HighScore.ORDERS:
+            raise ValueError(f"Unknown order: {order!r}")
+        HighScore.flush()
+        cur = HighScore.connect().cursor()
+        cur.row_factory = sql.Row
+        return cur.execute(
+            f"""SELECT ID, UserName, Score, Date FROM HighScores {where}
+                ORDER BY {HighScore.ORDERS[order]}
+                LIMIT :limit OFFSET :offset""",
+            params
+        ).fetchall()
+
+    @staticmethod
+    def _entry(
+            row: sql.Row
+    ) -> tuple[tuple[str, int], Callable[[], None]]:
+        """Forme d'une ligne retournée par `get_scores`."""
+        return (
+            (row["UserName"], row["Score"]),
+            partial(HighScore.delete_score, row["ID"])
+        )
 
     @staticmethod
     def delete_score(id) -> None:
@@ -141,10 +691,5 @@ class HighScore:
             id: L'identifiant principal (PRIMARY KEY) à utiliser pour
               déterminer quelle ligne supprimer.
         """
-        con = HighScore.connect()
-        con.cursor().execute(
-                "DELETE FROM HighScores WHERE ID = ?", (id,)
-        )
-
-        con.commit()
-        con.close()
+        with HighScore.connect() as con:
+            con.execute(HighScore.DELETE, (id,))
@@ -24,13 +24,19 @@ from dataclasses import dataclass
 from enum import Enum
 import random
 
+from Profiler import profiler
 from Objects.Object import Object  # type: ignore
 from Objects.AliveObject import AliveObject  # type: ignore
 from Objects.Alien import Alien  # type: ignore
 from Objects.Asteroid import Asteroid  # type: ignore
 from Objects.Bullet import Bullet  # type: ignore
+from Objects.Collisions import bounds_of, collision_pairs, sides_of  # type: ignore
+from Objects.EntityStore import EntityStore, HAS_NUMPY  # type: ignore
 from Objects.Modifiers import ALLMODS, Experience, Modifiers  # type: ignore
-from Objects.Position import Point  # type: ignore
+from Objects.Pool import ObjectPool  # type: ignore
+from Objects.Position import Point, Dimension2D  # type: ignore
+from Objects.SpatialHash import SpatialHash  # type: ignore
+from Objects.SpriteRegistry import SpriteRegistry  # type: ignore
 from Objects.Vaisseau import Vaisseau  # type: ignore
 
 
@@ -60,44 +66,91 @@ class Model(ABC):
 
 
 class GameModel:
-    """Contient la logique et l'état d'une partie en cours."""
-
-    def __init__(self, difficulty: Difficulty):
+    """Contient la logique et l'état d'une partie en cours.
+
+    Args:
+        difficulty: Difficulté de la partie.
+        dimension: Taille du terrain de jeu. Les objets qui en sortent
+          sont retirés de la partie.
+        vectorize: Si vrai, les objets qui se déplacent en ligne droite
+          sont conservés dans un `EntityStore` et déplacés ensemble.
+          Activé par défaut si NumPy est installé.
+        seed: Graine du générateur aléatoire de la partie. Une même
+          graine et les mêmes entrées donnent la même partie. Par
+          défaut, une graine est tirée au hasard. Ramenée sur 64 bits
+          (`SEED_MASK`).
+    """
+    KEEP_OFFSCREEN = (Vaisseau, Experience)
+    """Objets qui ne sont jamais retirés lorsqu'ils sortent du terrain"""
+    POOLED = (Bullet, Alien, Asteroid, Experience)
+    """Objets réutilisés après leur retrait (voir `ObjectPool`)"""
+    SEED_MASK = 2**64 - 1
+    """Les graines sont ramenées sur 64 bits non signés, la taille
+    enregistrée par `Replay` et `Snapshot`"""
+
+    def __init__(
+            self,
+            difficulty: Difficulty,
+            dimension: Dimension2D = Dimension2D(1200, 800),
+            vectorize: bool = HAS_NUMPY,
+            seed: int | None = None
+    ):
+        self.seed = (
+            random.getrandbits(32) if seed is None else seed & self.SEED_MASK
+        )
+        self.rng = random.Random(self.seed)
+        """Seule source de hasard de la partie (voir `Replay`)"""
         self.difficulty = difficulty
+        self.dimension = dimension
         self.player = Vaisseau(Point(590, 750))
-        self.sprites: list[Object] = [self.player]
+        self.sprites = SpriteRegistry([self.player])
+        self.vectorize = vectorize
+        """Si vrai, déplacements et collisions sont calculés avec NumPy"""
+        self.store = EntityStore() if vectorize else None
         self.stats = GameStats()
         self.score = 0
+        self.invulnerable = False
+        """Si vrai, les collisions n'infligent aucun dégât au joueur"""
+        self.grid = SpatialHash()
+        """Phase large de `get_collisions`, reconstruite à chaque appel."""
+        self.pools: dict[type, ObjectPool] = {
+            cls: ObjectPool(cls) for cls in self.POOLED
+        }
 
     @overload
     def get_collisions(
-            self, arg: Type[ObjT1], cls: Type[ObjT2]
+            self, arg: Type[ObjT1], cls: Type[ObjT2], *, opposing: bool = ...
     ) -> list[tuple[ObjT1, ObjT2]]: ...
 
     @overload
     def get_collisions(
-            self, arg: Type[ObjT1], cls: tuple[Type[Object], ...]
+            self, arg: Type[ObjT1], cls: tuple[Type[Object], ...],
+            *, opposing: bool = ...
     ) -> list[tuple[ObjT1, Object]]: ...
 
     @overload
     def get_collisions(
-            self, arg: Object, cls: Type[ObjT1]
+            self, arg: Object, cls: Type[ObjT1], *, opposing: bool = ...
     ) -> list[ObjT1]: ...
 
     @overload
     def get_collisions(
-            self, arg: Object, cls: tuple[Type[Object], ...]
+            self, arg: Object, cls: tuple[Type[Object], ...],
+            *, opposing: bool = ...
     ) -> list[Object]: ...
 
     def get_collisions(
             self, arg: Object | Type[ObjT1],
             cls: Type[ObjT2] | tuple[Type[Object], ...],
+            *, opposing: bool = False
     ):
         """Retourne une liste d'objets en collision.
 
         Args:
             arg: L'objet ou le type principal.
             cls: La ou les classes des objets qu'on veut comparer.
+            opposing: Si vrai, ignore les paires d'objets du même côté
+              (`side`).
 
         Returns:
             Si le premier paramètre est un objet, une liste de tous les
@@ -107,34 +160,70 @@ class GameModel:
             qui sont en collision.
         """
         comparelist = self.get_all_of(cls)
+        if self.vectorize:
+            return self._get_collisions_vectorized(arg, comparelist, opposing)
+
         if isinstance(arg, (type, tuple)):
+            # Seuls les objets qui partagent une cellule peuvent se
+            # toucher, et `query` conserve l'ordre de `comparelist`.
+            self.grid.rebuild(comparelist)
             return [
                 (obj1, obj2)
                 for obj1 in self.get_all_of(arg)
-                for obj2 in comparelist
+                for obj2 in self.grid.query(obj1)
                 if obj1.collides(obj2)
                 and obj1 is not obj2
+                and not (opposing and obj1.side == obj2.side)
             ]
         else:
             return [
                 obj
                 for obj in comparelist
                 if obj.collides(arg)
+                and not (opposing and obj.side == arg.side)
             ]
 
+    def _get_collisions_vectorized(
+            self, arg: Object | Type[Object] | tuple[Type[Object], ...],
+            comparelist: list[Object], opposing: bool
+    ) -> list:
+        """Version de `get_collisions` qui teste toutes les paires en
+        une seule opération NumPy.
+        """
+        single = not isinstance(arg, (type, tuple))
+        group = [arg] if single else self.get_all_of(arg)
+        if not group or not comparelist:
+            return []
+
+        sides = sides_of(group, comparelist) if opposing else (None, None)
+        index_a, index_b = collision_pairs(
+            bounds_of(group), bounds_of(comparelist), *sides
+        )
+        if single:
+            return [comparelist[j] for j in index_b.tolist()]
+        return [
+            (group[i], comparelist[j])
+            for i, j in zip(index_a.tolist(), index_b.tolist())
+            if group[i] is not comparelist[j]
+        ]
+
     def collisions_update(self) -> set[Object]:
         # TODO: Could probably be done in a single loop
         out: set[Object] = set()
 
         # Collisions avec le joueur
         for obj in self.get_collisions(self.player, (Alien, Asteroid)):
-            self.player.hit(obj.damage)
+            if not self.invulnerable:
+                self.player.hit(obj.damage)
             out.add(obj)
 
         # Collisions balles
-        for (bullet, victim) in self.get_collisions(Bullet, AliveObject):
-            if bullet.side != victim.side and bullet not in out:
-                victim.hit(bullet.damage)
+        for (bullet, victim) in self.get_collisions(
+                Bullet, AliveObject, opposing=True
+        ):
+            if bullet not in out:
+                if victim is not self.player or not self.invulnerable:
+                    victim.hit(bullet.damage)
                 out.add(bullet)
                 if not victim.alive():
                     out.add(victim)
@@ -154,43 +243,135 @@ class GameModel:
 
         return out
 
-    def update(self, *, kill_if: Callable[[Object], bool]) -> set[Object]:
+    def is_offscreen(self, obj: Object) -> bool:
+        """Vérifie si un objet est entièrement sorti du terrain."""
+        if isinstance(obj, self.KEEP_OFFSCREEN):
+            return False
+        x0, y0, x1, y1 = obj.bounds
+        return (
+            x1 < 0 or x0 > self.dimension.width
+            or y1 < 0 or y0 > self.dimension.height
+        )
+
+    def get_offscreen(self) -> list[Object]:
+        """Retourne tous les objets sortis du terrain."""
+        out = [
+            obj
+            for obj in self.sprites
+            if obj.store is None and self.is_offscreen(obj)
+        ]
+        if self.store is not None:
+            out += [
+                obj
+                for obj in self.store.outside(
+                    self.dimension.width, self.dimension.height
+                )
+                if not isinstance(obj, self.KEEP_OFFSCREEN)
+            ]
+        return out
+
+    def update(
+            self, *, kill_if: Callable[[Object], bool] | None = None
+    ) -> set[Object]:
         """Met à jour la position de tous les objets et vérifie les
         collisions.
+
+        Args:
+            kill_if: Condition pour retirer un objet après son
+              déplacement. Par défaut, les objets sortis du terrain
+              (voir `is_offscreen`) sont retirés.
+
+        Returns:
+            Les objets retirés de la partie.
         """
-        out: set[Object] = set()
+        if self.store is not None:
+            self.store.step()
         for obj in self.sprites:
-            obj.update()
-            if kill_if(obj):
-                out.add(obj)
+            if obj.store is None:  # Sinon, déjà déplacé par le stockage
+                obj.update()
+        if self.store is not None:
+            # Attire les Experience vers la position finale du joueur
+            x, y = self.player.coords
+            self.store.attract(
+                x + self.player.width / 2, y + self.player.height / 2
+            )
+
+        out: set[Object]
+        if kill_if is None:
+            out = set(self.get_offscreen())
+        else:
+            out = {obj for obj in self.sprites if kill_if(obj)}
+        profiler.lap("movement")
 
         out.update(self.collisions_update())
+        profiler.lap("collisions")
 
         for obj in out:
-            self.sprites.remove(obj)
+            self.remove(obj)
 
         return out
 
+    def add(self, obj: Object) -> None:
+        """Ajoute un objet à la partie."""
+        self.sprites.append(obj)
+        if self.store is not None and EntityStore.accepts(obj):
+            self.store.bind(obj)
+
+    def extend(self, objects: list[Object]) -> None:
+        """Ajoute plusieurs objets à la partie, dans l'ordre."""
+        for obj in objects:
+            self.sprites.append(obj)
+        if self.store is not None:
+            self.store.bind_all([
+                obj for obj in objects if EntityStore.accepts(obj)
+            ])
+
+    def remove(self, obj: Object) -> None:
+        """Retire un objet de la partie. S'il est d'une classe
+        réutilisée, il retourne dans sa réserve et ne doit plus être
+        utilisé.
+        """
+        self.sprites.remove(obj)
+        if obj.store is not None:
+            obj.store.release(obj)
+        pool = self.pools.get(type(obj))
+        if pool is not None:
+            pool.release(obj)
+
+    def make(self, cls: Type[ObjT1], *args) -> ObjT1:
+        """Crée un objet, en réutilisant un objet retiré si possible.
+        L'objet n'est pas ajouté à la partie.
+        """
+        pool = self.pools.get(cls)
+        return pool.acquire(*args) if pool is not None else cls(*args)
+
+    def pool_stats(self) -> dict[str, dict[str, float]]:
+        """Retourne les statistiques de chaque réserve d'objets."""
+        return {cls.__name__: pool.stats() for cls, pool in self.pools.items()}
+
     def spawn_alien(self, maxwidth: float) -> Alien:
-        alien = Alien(Point(random.random()*maxwidth, 0))
-        self.sprites.append(alien)
+        alien = self.make(Alien, Point(self.rng.random()*maxwidth, 0))
+        self.add(alien)
         return alien
 
     def spawn_asteroid(self, maxwidth: float) -> Asteroid:
-        asteroid = Asteroid(Point(random.random()*maxwidth, 0))
-        self.sprites.append(asteroid)
+        asteroid = self.make(Asteroid, Point(self.rng.random()*maxwidth, 0))
+        self.add(asteroid)
         return asteroid
 
     def spawn_modifier(self, maxwidth: float) -> Modifiers:
-        modtype = random.choice(ALLMODS)
-        mod = modtype(Point(random.random()*maxwidth, 0))
-        self.sprites.append(mod)
+        modtype = self.rng.choice(ALLMODS)
+        mod = modtype(Point(self.rng.random()*maxwidth, 0))
+        self.add(mod)
         return mod
 
     def spawn_experience(self, maxwidth: float, val: int = None) -> Experience:
         val = val or int(self.difficulty.value)  # Easy ne donne pas d'exp
-        exp = Experience(Point(random.random()*maxwidth, 0), val, self.player)
-        self.sprites.append(exp)
+        exp = self.make(
+                Experience, Point(self.rng.random()*maxwidth, 0), val,
+                self.player, self.rng
+        )
+        self.add(exp)
         return exp
 
     def shoot(
@@ -206,10 +387,9 @@ class GameModel:
         """
         if isinstance(shooter, (type, tuple)):
             shooters: list[AliveObject] = self.get_all_of(shooter)
-            bullet = random.choice(shooters).shoot()
-        else:
-            bullet = shooter.shoot()
-        self.sprites.append(bullet)
+            shooter = self.rng.choice(shooters)
+        bullet = shooter.shoot(lambda *args: self.make(Bullet, *args))
+        self.add(bullet)
         return bullet
 
     @overload
@@ -220,7 +400,7 @@ class GameModel:
 
     def get_all_of(self, cls: Type[ObjT1] | tuple[Type[Object], ...]):
         """Retourne tous les sprites d'une ou plusieurs classes."""
-        return [obj for obj in self.sprites if isinstance(obj, cls)]
+        return self.sprites.get_all_of(cls)
 
 
 class HighscoreModel(Model):
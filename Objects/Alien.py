@@ -18,6 +18,8 @@
 # D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
 # OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
 
+from typing import Callable
+
 from .AliveObject import AliveObject  # type: ignore
 from .Position import Vecteur, Point  # type: ignore
 from .Bullet import Bullet  # type: ignore
@@ -27,6 +29,9 @@ ALIENTYPES = (1, 2, 3, 4, 5)
 
 class Alien(AliveObject):
     """Classe abstraite pour les aliens"""
+    __slots__ = ("firepower",)
+    EXTRA_STATE = ("firepower",)
+
     def __init__(self, position: Point):
         super().__init__(position, width=25, height=25)
         self.velocity = Vecteur(0, 5)
@@ -35,5 +40,5 @@ class Alien(AliveObject):
         self.firepower = 10 # * difficulty
         self.side = "evil"
 
-    def shoot(self) -> Bullet:
-        return Bullet(self.center, self.firepower, Vecteur(0, 15), "evil")
+    def shoot(self, factory: Callable[..., Bullet] = Bullet) -> Bullet:
+        return factory(self.center, self.firepower, Vecteur(0, 15), "evil")
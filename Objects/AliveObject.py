@@ -24,6 +24,8 @@ from .Object import Object  # type: ignore
 
 class AliveObject(Object, ABC):
     """Classe abstraite représentant un objet avec de la vie."""
+    __slots__ = ()
+
     def __init__(self, position: Point, width: float, height: float):
         super().__init__(position, width, height)
 
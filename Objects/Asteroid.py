@@ -23,6 +23,8 @@ from .Position import Vecteur, Point  # type: ignore
 
 class Asteroid(AliveObject):
     """Classe pour les astéroides"""
+    __slots__ = ()
+
     def __init__(self, position: Point):
         super().__init__(position, width=5, height=5)
         self.velocity = Vecteur(0, 7)
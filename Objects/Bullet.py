@@ -23,6 +23,8 @@ from .Position import Vecteur, Point  # type: ignore
 
 class Bullet(Object):
     """Classe pour les obus"""
+    __slots__ = ()
+
     def __init__(
             self,
             position: Point,
@@ -0,0 +1,150 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""Contient un test de collision vectorisé entre deux groupes d'objets.
+
+Nécessite NumPy (voir `HAS_NUMPY`).
+"""
+from __future__ import annotations
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel
+    np = None
+
+from .Object import Object  # type: ignore
+
+HAS_NUMPY = np is not None
+
+MAX_CANDIDATES = 1 << 20
+"""Nombre maximal de paires candidates testées à la fois, pour limiter
+la mémoire utilisée"""
+
+
+def bounds_of(objects: Sequence[Object]):
+    """Retourne un tableau (n, 4) des coordonnées (x0, y0, x1, y1) des
+    points de chaque objet.
+
+    Les objets d'un même `EntityStore` sont copiés directement de ses
+    tableaux.
+    """
+    bounds = np.empty((len(objects), 4))
+    store = next((obj.store for obj in objects if obj.store is not None), None)
+    stored, rows = [], []
+    for index, obj in enumerate(objects):
+        if store is not None and obj.store is store:
+            stored.append(index)
+            rows.append(obj.row)
+        else:
+            bounds[index] = obj.bounds
+    if stored:
+        bounds[stored] = store.bounds[rows]
+    return bounds
+
+
+def sides_of(*groups: Sequence[Object]) -> list:
+    """Retourne, pour chaque groupe, un tableau d'entiers représentant
+    le `side` de chaque objet. Deux objets du même côté ont le même
+    entier, peu importe leur groupe.
+    """
+    codes: dict[str, int] = {}
+    return [
+        np.array(
+            [codes.setdefault(obj.side, len(codes)) for obj in group],
+            dtype=np.intp
+        )
+        for group in groups
+    ]
+
+
+def _overlap(a0, a1, b0, b1):
+    """Vrai si une extrémité de l'intervalle b est dans l'intervalle a."""
+    return ((a0 <= b0) & (b0 <= a1)) | ((a0 <= b1) & (b1 <= a1))
+
+
+def _test(bounds_a, bounds_b):
+    """Test de `Object.collides` appliqué à des paires de lignes."""
+    ax0, ay0, ax1, ay1 = bounds_a.T
+    bx0, by0, bx1, by1 = bounds_b.T
+    return (
+        _overlap(ax0, ax1, bx0, bx1) & _overlap(ay0, ay1, by0, by1)
+    ) | (
+        _overlap(bx0, bx1, ax0, ax1) & _overlap(by0, by1, ay0, ay1)
+    )
+
+
+def collision_pairs(bounds_a, bounds_b, sides_a=None, sides_b=None):
+    """Trouve toutes les paires en collision entre deux groupes.
+
+    Les objets de b sont triés selon x0: pour chaque objet de a, seuls
+    ceux dont l'intervalle en x peut chevaucher le sien sont candidats
+    (balayage). Les candidats passent ensuite le même test que
+    `Object.collides`, le tout sans boucle Python par paire.
+
+    Args:
+        bounds_a: Tableau (n, 4) des points du premier groupe.
+        bounds_b: Tableau (m, 4) des points du second groupe.
+        sides_a, sides_b: Si donnés, seules les paires dont les côtés
+          (voir `sides_of`) diffèrent sont retournées.
+
+    Returns:
+        Deux tableaux d'indices (i, j) tels que `a[i]` touche `b[j]`,
+        triés comme le seraient deux boucles imbriquées sur a puis b.
+    """
+    n, m = len(bounds_a), len(bounds_b)
+    if not n or not m:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+
+    order = np.argsort(bounds_b[:, 0], kind="stable")
+    sorted_x0 = bounds_b[order, 0]
+    max_width = (bounds_b[:, 2] - bounds_b[:, 0]).max()
+    # Un objet b qui chevauche a en x a: a.x0 - largeur <= b.x0 <= a.x1
+    first = np.searchsorted(sorted_x0, bounds_a[:, 0] - max_width, "left")
+    last = np.searchsorted(sorted_x0, bounds_a[:, 2], "right")
+    counts = np.maximum(last - first, 0)
+    ends = np.cumsum(counts)
+
+    found_a, found_b = [], []
+    start = 0
+    while start < n:
+        # Assez de lignes de a pour remplir MAX_CANDIDATES (au moins une)
+        offset = ends[start] - counts[start]
+        stop = max(
+            start + 1,
+            int(np.searchsorted(ends, offset + MAX_CANDIDATES, "right"))
+        )
+        chunk = counts[start:stop]
+        index_a = np.repeat(np.arange(start, stop), chunk)
+        rank = np.arange(len(index_a)) - np.repeat(
+            ends[start:stop] - chunk - offset, chunk
+        )
+        index_b = order[np.repeat(first[start:stop], chunk) + rank]
+
+        hit = _test(bounds_a[index_a], bounds_b[index_b])
+        if sides_a is not None and sides_b is not None:
+            hit &= sides_a[index_a] != sides_b[index_b]
+        found_a.append(index_a[hit])
+        found_b.append(index_b[hit])
+        start = stop
+
+    index_a, index_b = np.concatenate(found_a), np.concatenate(found_b)
+    nested = np.lexsort((index_b, index_a))
+    return index_a[nested], index_b[nested]
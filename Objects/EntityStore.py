@@ -0,0 +1,240 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""Contient un stockage optionnel de l'état des objets sous forme de
+tableaux NumPy contigus.
+
+NumPy n'est pas requis pour jouer. S'il n'est pas installé,
+`HAS_NUMPY` est faux et le modèle déplace les objets un par un.
+"""
+from __future__ import annotations
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel
+    np = None
+
+from .Object import Object  # type: ignore
+from .Modifiers import Experience  # type: ignore
+from .Position import Vecteur, Point  # type: ignore
+
+HAS_NUMPY = np is not None
+
+
+class EntityStore:
+    """Structure de tableaux contenant la position, la vélocité,
+    l'accélération et la demi-taille des objets qui s'y trouvent.
+
+    Seuls les objets qui se déplacent en ligne droite (ceux qui
+    utilisent `Object.update` sans le redéfinir) et les `Experience`,
+    qui sont en plus attirées vers le joueur (voir `attract`), y sont
+    acceptés. Un objet lié au stockage lit et écrit son état dans la
+    ligne `obj.row`, et `step` les déplace tous en une seule opération.
+    `bounds` contient les points de chaque objet (x0, y0, x1, y1), tels
+    que `Object.points` les retournerait.
+
+    Les lignes restent contiguës: retirer un objet déplace le dernier
+    à sa place.
+    """
+    def __init__(self, capacity: int = 256):
+        if np is None:
+            raise RuntimeError("EntityStore requires NumPy.")
+        self.count = 0
+        self.position = np.zeros((capacity, 2))
+        """Point supérieur gauche ↖ de chaque objet"""
+        self.velocity = np.zeros((capacity, 2))
+        self.acceleration = np.zeros(capacity)
+        self.half = np.zeros((capacity, 2))
+        """Demi-largeur et demi-hauteur de chaque objet"""
+        self.bounds = np.zeros((capacity, 4))
+        self.attraction = np.zeros(capacity)
+        """Force d'attraction vers le joueur, nulle sauf pour les
+        `Experience`"""
+        self.objects: list[Object] = []
+        """Objet associé à chaque ligne"""
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def capacity(self) -> int:
+        return len(self.acceleration)
+
+    @staticmethod
+    def accepts(obj: Object) -> bool:
+        """Retourne si l'objet peut être déplacé par `step` (et
+        `attract`).
+        """
+        update = type(obj).update
+        return update is Object.update or update is Experience.update
+
+    def _grow(self) -> None:
+        """Double la capacité des tableaux."""
+        capacity = self.capacity * 2
+        for name in (
+                "position", "velocity", "acceleration", "half", "bounds",
+                "attraction"
+        ):
+            old = getattr(self, name)
+            new = np.zeros((capacity, *old.shape[1:]))
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def bind(self, obj: Object) -> None:
+        """Copie l'état de l'objet dans une nouvelle ligne et y lie
+        l'objet.
+        """
+        if obj.store is not None:
+            raise ValueError(f"{obj!r} is already in a store")
+        if self.count == self.capacity:
+            self._grow()
+
+        row = self.count
+        position, velocity = obj.position, obj.velocity
+        (x0, y0), (x1, y1) = obj.points
+        self.position[row] = (position.x, position.y)
+        self.velocity[row] = (velocity.real, velocity.imag)
+        self.acceleration[row] = obj.acceleration
+        self.half[row] = (obj.width / 2, obj.height / 2)
+        self.bounds[row] = (x0, y0, x1, y1)
+        self.attraction[row] = (
+            obj.ATTRACTION if isinstance(obj, Experience) else 0
+        )
+        self.objects.append(obj)
+        self.count += 1
+        obj.store, obj.row = self, row
+
+    def bind_all(self, objects: list[Object]) -> None:
+        """Comme `bind` pour chaque objet, mais remplit les tableaux en
+        une seule opération.
+        """
+        if not objects:
+            return
+        for obj in objects:
+            if obj.store is not None:
+                raise ValueError(f"{obj!r} is already in a store")
+        start, end = self.count, self.count + len(objects)
+        while self.capacity < end:
+            self._grow()
+
+        # Colonnes de `Object.get_state`
+        state = np.array([obj.get_state() for obj in objects])
+        self.position[start:end] = state[:, 0:2]
+        self.bounds[start:end] = state[:, 2:6]
+        self.half[start:end] = state[:, 6:8] / 2
+        self.velocity[start:end] = state[:, 8:10]
+        self.acceleration[start:end] = state[:, 10]
+        self.attraction[start:end] = [
+            obj.ATTRACTION if isinstance(obj, Experience) else 0
+            for obj in objects
+        ]
+        self.objects.extend(objects)
+        self.count = end
+        for row, obj in enumerate(objects, start):
+            obj.store, obj.row = self, row
+
+    def release(self, obj: Object) -> None:
+        """Détache l'objet du stockage en lui redonnant son état."""
+        if obj.store is not self:
+            raise ValueError(f"{obj!r} is not in this store")
+        row, last = obj.row, self.count - 1
+        position, velocity = obj.position, obj.velocity
+        acceleration, points = obj.acceleration, obj.points
+        obj.store, obj.row = None, -1
+        obj.position, obj.velocity = position, velocity
+        obj.acceleration, obj.points = acceleration, points
+
+        # Le dernier objet prend la place libérée
+        moved = self.objects.pop()
+        if moved is not obj:
+            self.position[row] = self.position[last]
+            self.velocity[row] = self.velocity[last]
+            self.acceleration[row] = self.acceleration[last]
+            self.half[row] = self.half[last]
+            self.bounds[row] = self.bounds[last]
+            self.attraction[row] = self.attraction[last]
+            self.objects[row] = moved
+            moved.row = row
+        self.count -= 1
+
+    def get_position(self, row: int) -> Point:
+        return Point(*self.position[row].tolist())
+
+    def get_velocity(self, row: int) -> Vecteur:
+        return Vecteur(*self.velocity[row].tolist())
+
+    def get_points(self, row: int) -> tuple[Point, Point]:
+        x0, y0, x1, y1 = self.bounds[row].tolist()
+        return (Point(x0, y0), Point(x1, y1))
+
+    def step(self) -> None:
+        """Équivalent vectorisé de `Object.update` pour toutes les
+        lignes: ajuste la vitesse selon l'accélération (en l'arrêtant
+        plutôt que de l'inverser) puis déplace les objets.
+        """
+        n = self.count
+        if not n:
+            return
+        velocity = self.velocity[:n]
+        acceleration = self.acceleration[:n]
+
+        speed = np.hypot(velocity[:, 0], velocity[:, 1])
+        target = speed + acceleration
+        scale = np.divide(
+            target, speed, out=np.ones_like(speed), where=speed > 0
+        )
+        velocity *= scale[:, None]
+        velocity[(np.abs(target) > speed) & (acceleration < 0)] = 0
+
+        position = self.position[:n]
+        position += velocity
+        self.bounds[:n, :2] = position
+        self.bounds[:n, 2:] = position + self.half[:n] * 2
+
+    def attract(self, x: float, y: float) -> None:
+        """Équivalent vectorisé de la fin de `Experience.update` pour
+        toutes les lignes attirées: oriente leur vélocité vers le point
+        (x, y), le centre du joueur.
+        """
+        rows = np.flatnonzero(self.attraction[:self.count])
+        if not rows.size:
+            return
+        position = self.position[rows]
+        target = np.array((x, y))
+        to_target = target - position
+        to_centre = target - (position + self.half[rows])
+        distance = np.hypot(to_centre[:, 0], to_centre[:, 1])
+        length = np.hypot(to_target[:, 0], to_target[:, 1])[:, None]
+        # Aucune attraction pour les objets déjà centrés sur le point
+        strength = np.divide(
+            self.attraction[rows], distance,
+            out=np.zeros_like(distance), where=distance > 0
+        )[:, None]
+        self.velocity[rows] += np.divide(
+            to_target * strength, length,
+            out=np.zeros_like(to_target), where=length > 0
+        )
+
+    def outside(self, width: float, height: float) -> list[Object]:
+        """Retourne les objets dont les points sont entièrement hors du
+        rectangle allant de (0, 0) à (width, height).
+        """
+        x0, y0, x1, y1 = self.bounds[:self.count].T
+        mask = (x1 < 0) | (x0 > width) | (y1 < 0) | (y0 > height)
+        return [self.objects[row] for row in np.flatnonzero(mask).tolist()]
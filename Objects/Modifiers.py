@@ -21,12 +21,14 @@ from abc import ABC, abstractmethod
 import random
 
 from .Object import Object  # type: ignore
-from .Position import Vecteur, Point  # type: ignore
+from .Position import Vecteur, Point, norm, scale_to  # type: ignore
 from .Vaisseau import Vaisseau  # type: ignore
 
 
 class Modifiers(Object, ABC):
     """Classe abstaite des modificateurs de vaisseau"""
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.velocity = Vecteur(0, 5)
@@ -37,6 +39,8 @@ class Modifiers(Object, ABC):
 
 class Health(Modifiers):
     """Modificateur de vaisseau: HP+"""
+    __slots__ = ()
+
     def __init__(self, position: Point):
         super().__init__(position, width=25, height=25)
 
@@ -58,9 +62,24 @@ class Health(Modifiers):
 
 class Experience(Modifiers):
     """Objet qui donne des points en le touchant."""
-    def __init__(self, position: Point, value: int, player: Vaisseau):
+    __slots__ = ("value", "player")
+    EXTRA_STATE = ("value",)
+
+    ATTRACTION = 75
+    """Force d'attraction vers le centre du joueur"""
+
+    def __init__(
+            self,
+            position: Point,
+            value: int,
+            player: Vaisseau,
+            rng: random.Random | None = None
+    ):
+        """`rng` est le générateur aléatoire de la partie, ou le module
+        `random` par défaut."""
         super().__init__(position, width=10, height=10)
-        self.velocity = Vecteur(0, random.random() * 10)
+        source = random if rng is None else rng
+        self.velocity = Vecteur(0, source.random() * 10)
         self.value = value
         self.player = player
         self.acceleration = -0.1
@@ -72,11 +91,17 @@ class Experience(Modifiers):
     def update(self) -> None:
         super().update()
 
-        destination = self.player.center
-        movevec = destination - self.position
-        a = destination - self.center
-        b = a.norme
-        self.velocity += movevec.asnorm(75 / b)
+        px, py = self.player.coords
+        cx = px + self.player.width / 2  # Centre du joueur
+        cy = py + self.player.height / 2
+        b = norm(
+            cx - (self._x + self._width / 2),
+            cy - (self._y + self._height / 2)
+        )
+        if b:  # Sinon, déjà centrée sur le joueur
+            ax, ay = scale_to(cx - self._x, cy - self._y, self.ATTRACTION / b)
+            self._vx += ax
+            self._vy += ay
         # if movevec.norme:
         #     movevec = movevec.asnorm(
         #             min(
@@ -20,42 +20,176 @@
 from __future__ import annotations
 from abc import ABC
 
-from .Position import Vecteur, Point, Dimension2D  # type: ignore
+from .Position import Vecteur, Point, Dimension2D, integrate  # type: ignore
 
 class Object(ABC):
-    """Classe abstraite représentant un objet du jeu quel qu'il soit."""
+    """Classe abstraite représentant un objet du jeu quel qu'il soit.
+
+    L'état est conservé dans des `__slots__` de nombres simples:
+    `position`, `points`, `dimension` et `velocity` construisent leur
+    `Point` ou leur `Vecteur` à la lecture seulement.
+
+    La position, la vélocité, l'accélération et les points peuvent
+    être conservés dans un `EntityStore`. L'objet n'est alors qu'une
+    vue sur sa ligne `row` du stockage `store`.
+    """
+    __slots__ = (
+        "store", "row",
+        "_x", "_y",  # Position
+        "_x0", "_y0", "_x1", "_y1",  # Points
+        "_width", "_height",
+        "_vx", "_vy",  # Vélocité
+        "_acceleration",
+        "id", "health", "damage", "side",
+    )
+
+    EXTRA_STATE: tuple[str, ...] = ()
+    """Attributs propres à la sous-classe conservés par `Snapshot`"""
+
     def __init__(self, position: Point, width: float, height: float):
-        self.dimension = Dimension2D(width, height)
+        self.store = None
+        """EntityStore contenant l'état de l'objet, s'il y en a un"""
+        self.row = -1
+        """Ligne de l'objet dans `store`"""
+        self._width, self._height = width, height
         self.position = position
         """Centre de l'objet"""
-        self.points = self.dimension.to_points(self.position, True)  # TODO: remove duplicate code (maybe remove annotation)
-        """Points supérieur gauche ↖ et inférieur droit ↘ de l'objeté"""
-        self.velocity = Vecteur(0, 0)
+        self._x0 = position.x - width / 2
+        self._y0 = position.y - height / 2
+        self._x1 = self._x0 + width
+        self._y1 = self._y0 + height
+        """Points supérieur gauche ↖ et inférieur droit ↘ de l'objet"""
+        self._vx, self._vy = 0.0, 0.0
         self.acceleration: float = 0
         self.id = 0
         self.health = 0
         self.damage = 0
         self.side = "neutral"  # Good guys or evil
 
+    def get_state(self) -> tuple[float, ...]:
+        """Retourne l'état de l'objet sous forme de nombres: position,
+        points, taille, vélocité, accélération, vie et dégâts.
+        """
+        velocity = self.velocity
+        return (
+            *self.coords, *self.bounds, self._width, self._height,
+            velocity.real, velocity.imag, self.acceleration,
+            self.health, self.damage
+        )
+
+    @classmethod
+    def from_state(cls, state: tuple[float, ...], side: str) -> Object:
+        """Recrée un objet à partir de `get_state`, sans appeler
+        `__init__`. Les attributs de `EXTRA_STATE` restent à remplir.
+        """
+        obj = cls.__new__(cls)
+        obj.store, obj.row, obj.id, obj.side = None, -1, 0, side
+        (
+            obj._x, obj._y, obj._x0, obj._y0, obj._x1, obj._y1,
+            obj._width, obj._height, obj._vx, obj._vy, obj._acceleration,
+            obj.health, obj.damage
+        ) = state
+        return obj
+
     def _update_points(self) -> None:
-        self.points = self.dimension.to_points(self.position, False)
+        if self.store is None:  # Sinon, calculés par le stockage
+            self._x0, self._y0 = self._x, self._y
+            self._x1 = self._x + self._width
+            self._y1 = self._y + self._height
+
+    @property
+    def position(self) -> Point:
+        if self.store is None:
+            return Point(self._x, self._y)
+        return self.store.get_position(self.row)
+
+    @position.setter
+    def position(self, value: Point) -> None:
+        if self.store is None:
+            self._x, self._y = value.x, value.y
+        else:
+            self.store.position[self.row] = (value.x, value.y)
+
+    @property
+    def coords(self) -> tuple[float, float]:
+        """Coordonnées (x, y) de `position`, sans créer de `Point`."""
+        if self.store is None:
+            return (self._x, self._y)
+        return tuple(self.store.position[self.row].tolist())
+
+    @property
+    def points(self) -> tuple[Point, Point]:
+        if self.store is None:
+            return (Point(self._x0, self._y0), Point(self._x1, self._y1))
+        return self.store.get_points(self.row)
+
+    @points.setter
+    def points(self, value: tuple[Point, Point]) -> None:
+        if self.store is not None:
+            raise AttributeError("points are computed by the store")
+        point0, point1 = value
+        self._x0, self._y0 = point0.x, point0.y
+        self._x1, self._y1 = point1.x, point1.y
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        """Coordonnées (x0, y0, x1, y1) de `points`, sans créer de
+        `Point`.
+        """
+        if self.store is None:
+            return (self._x0, self._y0, self._x1, self._y1)
+        return tuple(self.store.bounds[self.row].tolist())
+
+    @property
+    def dimension(self) -> Dimension2D:
+        return Dimension2D(self._width, self._height)
+
+    @dimension.setter
+    def dimension(self, value: Dimension2D) -> None:
+        self._width, self._height = value.width, value.height
+
+    @property
+    def velocity(self) -> Vecteur:
+        if self.store is None:
+            return Vecteur(self._vx, self._vy)
+        return self.store.get_velocity(self.row)
+
+    @velocity.setter
+    def velocity(self, value: Vecteur) -> None:
+        if self.store is None:
+            self._vx, self._vy = value.real, value.imag
+        else:
+            self.store.velocity[self.row] = (value.real, value.imag)
+
+    @property
+    def acceleration(self) -> float:
+        if self.store is None:
+            return self._acceleration
+        return float(self.store.acceleration[self.row])
+
+    @acceleration.setter
+    def acceleration(self, value: float) -> None:
+        if self.store is None:
+            self._acceleration = value
+        else:
+            self.store.acceleration[self.row] = value
 
     @property
     def width(self):
-        return self.dimension.width
+        return self._width
 
     @width.setter
     def width(self, value):
-        self.dimension.width = value
+        self._width = value
         self._update_points()
 
     @property
     def height(self):
-        return self.dimension.height
+        return self._height
 
     @height.setter
     def height(self, value):
-        self.dimension.height = value
+        self._height = value
         self._update_points()
 
     @property
@@ -68,15 +202,20 @@ class Object(ABC):
     
     @property
     def center(self) -> Point:
-        return self.position + self.dimension / 2
+        position = self.position
+        return Point(
+            position.x + self._width / 2, position.y + self._height / 2
+        )
 
     def _collision_test(self, other: Object) -> bool:
+        x0, y0, x1, y1 = self.bounds
+        ox0, oy0, ox1, oy1 = other.bounds
         return (  # Overlap X
-            self.points[0].x <= other.points[0].x <= self.points[1].x or
-            self.points[0].x <= other.points[1].x <= self.points[1].x
+            x0 <= ox0 <= x1 or
+            x0 <= ox1 <= x1
         ) and (  # Overlap Y
-            self.points[0].y <= other.points[0].y <= self.points[1].y or
-            self.points[0].y <= other.points[1].y <= self.points[1].y
+            y0 <= oy0 <= y1 or
+            y0 <= oy1 <= y1
         )
 
     def collides(self, other: Object) -> bool:
@@ -84,10 +223,14 @@ class Object(ABC):
         return self._collision_test(other) or other._collision_test(self)
 
     def update(self) -> None:
-        """Mise à jour de la position de l'objet selon sa vélocité"""
-        sp = self.speed
-        self.speed += self.acceleration 
-        if self.speed > sp and self.acceleration < 0:
-            self.speed = 0
-        self.position += self.velocity
+        """Mise à jour de la position de l'objet selon sa vélocité.
+
+        Un objet lié à un `EntityStore` est déplacé par
+        `EntityStore.step` et `EntityStore.attract`, pas par cette méthode.
+        """
+        if self.store is not None:
+            raise RuntimeError("bound objects are moved by EntityStore.step")
+        self._vx, self._vy = integrate(self._vx, self._vy, self._acceleration)
+        self._x += self._vx
+        self._y += self._vy
         self._update_points()
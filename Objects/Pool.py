@@ -0,0 +1,101 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""Contient une réserve d'objets réutilisables."""
+from __future__ import annotations
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class ObjectPool(Generic[T]):
+    """Réserve d'objets libérés qui peuvent être réutilisés au lieu
+    d'en créer de nouveaux.
+
+    Args:
+        factory: Crée un nouvel objet à partir des arguments de
+          `acquire`. Souvent la classe elle-même.
+        reset: Réinitialise un objet libéré avec les arguments de
+          `acquire`. Par défaut, appelle à nouveau `__init__`.
+        maxsize: Nombre maximal d'objets libres conservés.
+    """
+    def __init__(
+            self,
+            factory: Callable[..., T],
+            reset: Callable[..., None] | None = None,
+            maxsize: int = 512
+    ):
+        self.factory = factory
+        self.reset = reset or (lambda obj, *args: type(obj).__init__(obj, *args))
+        self.maxsize = maxsize
+        self.free: list[T] = []
+        self.hits = 0
+        """Nombre d'objets réutilisés"""
+        self.misses = 0
+        """Nombre d'objets créés faute d'objet libre"""
+        self.in_use = 0
+        self.high_water = 0
+        """Nombre maximal d'objets utilisés en même temps"""
+
+    def __len__(self) -> int:
+        return len(self.free)
+
+    def acquire(self, *args) -> T:
+        """Retourne un objet libre réinitialisé, ou un nouvel objet."""
+        if self.free:
+            obj = self.free.pop()
+            self.reset(obj, *args)
+            self.hits += 1
+        else:
+            obj = self.factory(*args)
+            self.misses += 1
+        self.in_use += 1
+        self.high_water = max(self.high_water, self.in_use)
+        return obj
+
+    def release(self, obj: T) -> bool:
+        """Rend un objet à la réserve. Il ne doit plus être utilisé
+        ailleurs. Les objets qui n'ont pas été créés par la réserve
+        sont acceptés.
+
+        Returns:
+            Vrai si l'objet est conservé, faux si la réserve est pleine.
+        """
+        self.in_use = max(0, self.in_use - 1)
+        if len(self.free) < self.maxsize:
+            self.free.append(obj)
+            return True
+        return False
+
+    @property
+    def hit_rate(self) -> float:
+        """Proportion des demandes servies par un objet réutilisé."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, float]:
+        """Retourne les statistiques d'utilisation de la réserve."""
+        return {
+            "size": len(self.free),
+            "in_use": self.in_use,
+            "high_water": self.high_water,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+        }
@@ -17,7 +17,13 @@
 # DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
 # D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
 # OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
-"""Contient plusieurs classes utiles à la manipulation de positions."""
+"""Contient plusieurs classes utiles à la manipulation de positions.
+
+Les fonctions `norm`, `scale_to`, `integrate` et `move_towards` font
+les mêmes calculs que les opérations de `Vecteur` et `Point` sur des
+coordonnées simples, sans créer d'objets intermédiaires, pour les
+déplacements faits à chaque image.
+"""
 from __future__ import annotations
 from typing import overload, Iterator, Any
 
@@ -140,6 +146,8 @@ class Vecteur(complex):
 
 class Point:
     """Représente un point dans un plan cartésien 2D."""
+    __slots__ = ("x", "y")
+
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
@@ -220,3 +228,49 @@ class Dimension2D(Vecteur):
     @height.setter
     def height(self, value):
         self.imag = value
+
+
+def norm(x: float, y: float) -> float:
+    """Norme du vecteur (x, y), arrondie comme `Vecteur.norme` et
+    `numpy.hypot` (`math.hypot` diffère parfois au dernier chiffre).
+    """
+    return abs(complex(x, y))
+
+
+def scale_to(x: float, y: float, value: float) -> tuple[float, float]:
+    """Équivalent de `Vecteur(x, y).asnorm(value)`."""
+    current = norm(x, y)
+    if current:
+        return (x * value / current, y * value / current)
+    return (x, y)
+
+
+def integrate(
+        vx: float, vy: float, acceleration: float
+) -> tuple[float, float]:
+    """Retourne la vélocité (vx, vy) dont la norme a été augmentée de
+    `acceleration`. Une accélération négative arrête la vélocité au
+    lieu de l'inverser.
+    """
+    speed = norm(vx, vy)
+    if not speed:
+        return (vx, vy)
+    target = speed + acceleration
+    vx, vy = vx * target / speed, vy * target / speed
+    if acceleration < 0 and norm(vx, vy) > speed:
+        return (0.0, 0.0)
+    return (vx, vy)
+
+
+def move_towards(
+        x: float, y: float, tx: float, ty: float, max_distance: float
+) -> tuple[float, float]:
+    """Retourne le point (x, y) déplacé vers (tx, ty) d'au plus
+    `max_distance`.
+    """
+    dx, dy = tx - x, ty - y
+    distance = norm(dx, dy)
+    if not distance:
+        return (x, y)
+    step = min(distance, max_distance)
+    return (x + dx * step / distance, y + dy * step / distance)
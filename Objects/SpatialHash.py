@@ -0,0 +1,86 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""Contient une grille de hachage spatial utilisée comme phase large
+pour la détection de collisions.
+"""
+from __future__ import annotations
+from typing import Iterable
+
+import math
+
+from .Object import Object  # type: ignore
+
+
+class SpatialHash:
+    """Grille uniforme qui associe chaque cellule aux objets dont la
+    boîte englobante (`Object.points`) la chevauche.
+
+    Deux objets qui ne partagent aucune cellule ne peuvent pas être en
+    collision, ce qui permet d'éviter la comparaison de toutes les
+    paires. Les candidats retournés doivent quand même être validés
+    avec `Object.collides`.
+    """
+    def __init__(self, cell_size: float = 64):
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list[int]] = {}
+        self.objects: list[Object] = []
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    def clear(self) -> None:
+        """Vide la grille."""
+        self.cells.clear()
+        self.objects.clear()
+
+    def _cell_range(self, obj: Object) -> tuple[range, range]:
+        """Retourne les indices des cellules couvertes par l'objet."""
+        x0, y0, x1, y1 = obj.bounds
+        size = self.cell_size
+        return (
+            range(math.floor(x0 / size), math.floor(x1 / size) + 1),
+            range(math.floor(y0 / size), math.floor(y1 / size) + 1),
+        )
+
+    def insert(self, obj: Object) -> None:
+        """Ajoute un objet dans toutes les cellules qu'il chevauche."""
+        index = len(self.objects)
+        self.objects.append(obj)
+        xrange, yrange = self._cell_range(obj)
+        for cx in xrange:
+            for cy in yrange:
+                self.cells.setdefault((cx, cy), []).append(index)
+
+    def rebuild(self, objects: Iterable[Object]) -> None:
+        """Reconstruit la grille à partir des positions actuelles."""
+        self.clear()
+        for obj in objects:
+            self.insert(obj)
+
+    def query(self, obj: Object) -> list[Object]:
+        """Retourne les objets qui partagent au moins une cellule avec
+        `obj`, dans leur ordre d'insertion et sans doublons.
+        """
+        xrange, yrange = self._cell_range(obj)
+        found: set[int] = set()
+        for cx in xrange:
+            for cy in yrange:
+                found.update(self.cells.get((cx, cy), ()))
+        return [self.objects[index] for index in sorted(found)]
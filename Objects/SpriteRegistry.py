@@ -0,0 +1,118 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""Contient un registre de sprites indexé par classe."""
+from __future__ import annotations
+from typing import Iterable, Iterator, Type
+from itertools import chain
+from operator import itemgetter
+
+from .Object import Object  # type: ignore
+
+
+class SpriteRegistry:
+    """Collection ordonnée de sprites, groupés par classe concrète.
+
+    S'utilise comme la liste qu'elle remplace (`append`, `remove`,
+    itération, `len`, `in`), mais l'ajout et le retrait se font en
+    temps constant et `get_all_of` ne parcourt que les groupes des
+    classes demandées. L'itération suit toujours l'ordre d'ajout, ce
+    qui garde l'ordre d'affichage et de collision inchangé.
+    """
+    def __init__(self, sprites: Iterable[Object] = ()):
+        self._order: dict[Object, int] = {}
+        """Sprites dans l'ordre d'ajout, associés à leur numéro d'ordre"""
+        self._buckets: dict[type, dict[Object, int]] = {}
+        """Sprites groupés selon leur classe concrète"""
+        self._matches: dict[type | tuple, list[dict[Object, int]]] = {}
+        """Groupes correspondant à chaque requête déjà effectuée"""
+        self._merged: dict[type | tuple, list[Object]] = {}
+        """Résultat des requêtes sur plusieurs groupes, oublié lorsqu'un
+        de leurs groupes change"""
+        self._counter = 0
+        for obj in sprites:
+            self.append(obj)
+
+    def __iter__(self) -> Iterator[Object]:
+        return iter(self._order)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, obj: object) -> bool:
+        return obj in self._order
+
+    def append(self, obj: Object) -> None:
+        """Ajoute un sprite à la fin du registre."""
+        if obj in self._order:
+            raise ValueError(f"{obj!r} is already registered")
+        bucket = self._buckets.get(type(obj))
+        if bucket is None:
+            bucket = self._buckets[type(obj)] = {}
+            self._matches.clear()  # Nouvelle classe, requêtes à refaire
+        self._order[obj] = self._counter
+        bucket[obj] = self._counter
+        self._counter += 1
+        self._invalidate(type(obj))
+
+    def remove(self, obj: Object) -> None:
+        """Retire un sprite du registre.
+
+        Raises:
+            ValueError: Si le sprite n'est pas dans le registre.
+        """
+        try:
+            del self._order[obj]
+        except KeyError:
+            raise ValueError(f"{obj!r} is not registered") from None
+        del self._buckets[type(obj)][obj]
+        self._invalidate(type(obj))
+
+    def _invalidate(self, objtype: type) -> None:
+        """Oublie les résultats de `_merged` qui contiennent `objtype`."""
+        stale = [cls for cls in self._merged if issubclass(objtype, cls)]
+        for cls in stale:
+            del self._merged[cls]
+
+    def get_all_of(
+            self, cls: Type[Object] | tuple[Type[Object], ...]
+    ) -> list[Object]:
+        """Retourne tous les sprites d'une ou plusieurs classes (ou de
+        leurs sous-classes), dans l'ordre d'ajout.
+        """
+        buckets = self._matches.get(cls)
+        if buckets is None:
+            buckets = self._matches[cls] = [
+                bucket
+                for objtype, bucket in self._buckets.items()
+                if issubclass(objtype, cls)
+            ]
+
+        if len(buckets) == 1:
+            return list(buckets[0])
+        merged = self._merged.get(cls)
+        if merged is None:
+            # Chaque groupe est déjà trié, le tri ne fait que les
+            # fusionner (Timsort reconnaît les suites déjà triées)
+            entries = sorted(
+                chain.from_iterable(bucket.items() for bucket in buckets),
+                key=itemgetter(1)
+            )
+            merged = self._merged[cls] = [obj for obj, _ in entries]
+        return list(merged)
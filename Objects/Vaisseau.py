@@ -17,12 +17,17 @@
 # DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
 # D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
 # OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+from typing import Callable
+
 from .AliveObject import AliveObject  # type: ignore
-from .Position import Vecteur, Point  # type: ignore
+from .Position import Vecteur, Point, move_towards  # type: ignore
 from .Bullet import Bullet  # type: ignore
 
 class Vaisseau(AliveObject):
     """Classe représentant un vaisseau joueur."""
+    __slots__ = ("max_speed", "firepower")
+    EXTRA_STATE = ("max_speed", "firepower")
+
     def __init__(self, position: Point):
         super().__init__(position, width=100, height=100)
         self.max_speed = 10
@@ -31,13 +36,12 @@ class Vaisseau(AliveObject):
         self.side = "good"
 
     def move_to(self, destination: Point) -> None:
-        movevec = destination - self.position
-        if movevec.norme:
-            movevec = movevec.asnorm(min(movevec.norme, self.max_speed))
-            self.position += movevec
+        self._x, self._y = move_towards(
+            self._x, self._y, destination.x, destination.y, self.max_speed
+        )
 
-    def shoot(self) -> Bullet:
-        return Bullet(self.center, self.firepower, Vecteur(0, -15), "good")
+    def shoot(self, factory: Callable[..., Bullet] = Bullet) -> Bullet:
+        return factory(self.center, self.firepower, Vecteur(0, -15), "good")
 
     def update(self) -> None:
         if self.health > 100:
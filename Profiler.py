@@ -0,0 +1,180 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""Mesure la durée de chaque phase d'un tick du jeu."""
+
+# Documentation
+from __future__ import annotations
+
+# Modules standard
+from array import array
+import csv
+import math
+import os
+import time
+
+
+class TickProfiler:
+    """Chronomètre les phases d'un tick et conserve les `size`
+    dernières durées de chaque phase dans un tampon circulaire.
+
+    Désactivé, `start` et `lap` ne font rien: les appels peuvent rester
+    dans la boucle du jeu. Une phase dure du dernier `start` ou `lap`
+    jusqu'au `lap` qui la nomme.
+
+    Args:
+        size: Nombre de durées conservées par phase.
+    """
+    QUANTILES = (50, 95, 99)
+
+    directory = os.path.join(
+        os.path.dirname(__file__),
+        "Data", "profiles",
+    )
+
+    def __init__(self, size: int = 1024):
+        self.size = size
+        self.enabled = False
+        self._samples: dict[str, array] = {}
+        """Durées de chaque phase, en secondes"""
+        self._written: dict[str, int] = {}
+        """Nombre de durées écrites dans chaque tampon depuis le début"""
+        self._mark = 0.0
+
+    def toggle(self) -> bool:
+        """Active ou désactive les mesures et retourne le nouvel état."""
+        self.enabled = not self.enabled
+        self._mark = time.perf_counter()
+        return self.enabled
+
+    def clear(self) -> None:
+        self._samples.clear()
+        self._written.clear()
+
+    def start(self) -> None:
+        """Commence la première phase."""
+        if self.enabled:
+            self._mark = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """Termine la phase en cours et commence la suivante."""
+        if self.enabled:
+            now = time.perf_counter()
+            self.record(phase, now - self._mark)
+            self._mark = now
+
+    def record(self, phase: str, seconds: float) -> None:
+        """Ajoute une durée mesurée ailleurs, en remplaçant la plus
+        ancienne si le tampon de la phase est plein.
+        """
+        samples = self._samples.get(phase)
+        if samples is None:
+            samples = self._samples[phase] = array("d", bytes(8 * self.size))
+            self._written[phase] = 0
+        written = self._written[phase]
+        samples[written % self.size] = seconds
+        self._written[phase] = written + 1
+
+    def phases(self) -> list[str]:
+        """Retourne les phases mesurées, dans l'ordre de leur première
+        mesure.
+        """
+        return list(self._samples)
+
+    def samples(self, phase: str) -> list[float]:
+        """Retourne les durées conservées de la phase, de la plus
+        ancienne à la plus récente.
+        """
+        samples = self._samples.get(phase)
+        if samples is None:
+            return []
+        written = self._written[phase]
+        if written <= self.size:
+            return samples[:written].tolist()
+        split = written % self.size
+        return (samples[split:] + samples[:split]).tolist()
+
+    def percentiles(self, phase: str) -> dict[int, float]:
+        """Retourne les percentiles `QUANTILES` des durées de la phase,
+        en secondes (rang le plus proche).
+        """
+        values = sorted(self.samples(phase))
+        if not values:
+            return {}
+        ranks = {
+            quantile: math.ceil(quantile * len(values) / 100)
+            for quantile in self.QUANTILES
+        }
+        return {
+            quantile: values[max(rank, 1) - 1]
+            for quantile, rank in ranks.items()
+        }
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Retourne, pour chaque phase, le nombre de durées conservées,
+        leur moyenne, leurs percentiles et leur maximum, en ms.
+        """
+        out: dict[str, dict[str, float]] = {}
+        for phase in self._samples:
+            values = self.samples(phase)
+            out[phase] = {
+                "count": len(values),
+                "mean": 1000 * sum(values) / len(values),
+                **{
+                    f"p{quantile}": 1000 * value
+                    for quantile, value in self.percentiles(phase).items()
+                },
+                "max": 1000 * max(values),
+            }
+        return out
+
+    def report(self) -> str:
+        """Retourne `summary` sous forme de tableau."""
+        summary = self.summary()
+        columns = (
+            "count", "mean", *(f"p{q}" for q in self.QUANTILES), "max"
+        )
+        lines = [
+            f"{'phase (ms)':<16}" + "".join(f"{name:>10}" for name in columns)
+        ]
+        for phase, stats in summary.items():
+            lines.append(f"{phase:<16}{stats['count']:>10}" + "".join(
+                f"{stats[name]:>10.3f}" for name in columns[1:]
+            ))
+        return "\n".join(lines)
+
+    def dump(self, path: str | None = None) -> str:
+        """Écrit toutes les durées conservées dans un fichier CSV
+        (phase, rang, ms) et retourne son chemin. Par défaut, remplace
+        `ticks.csv` dans `directory`.
+        """
+        if path is None:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, "ticks.csv")
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(("phase", "sample", "ms"))
+            for phase in self._samples:
+                for index, seconds in enumerate(self.samples(phase)):
+                    writer.writerow((phase, index, f"{1000 * seconds:.6f}"))
+        return path
+
+
+profiler = TickProfiler()
+"""Profileur partagé par le modèle et les controlleurs"""
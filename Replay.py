@@ -0,0 +1,136 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""Permet d'enregistrer une partie et de la rejouer à l'identique."""
+
+# Documentation
+from __future__ import annotations
+from typing import Iterator, NamedTuple
+
+# Modules standard
+import os
+import struct
+
+
+class Event(NamedTuple):
+    """Entrée du joueur, appliquée juste avant le tick `tick`."""
+    tick: int
+    kind: int
+    x: int = 0
+    y: int = 0
+
+
+class Replay:
+    """Enregistrement d'une partie: la graine de `GameModel` et les
+    entrées du joueur, datées au tick près.
+
+    Une partie créée avec la même graine, à laquelle les mêmes entrées
+    sont données avant les mêmes ticks, se déroule de façon identique
+    (voir `HeadlessGameController.play`).
+
+    Le fichier contient un entête (`HEADER`) suivi d'un événement de
+    9 octets par entrée (`EVENT`). Les déplacements de la souris entre
+    deux ticks ne sont pas conservés: seul le dernier compte.
+    """
+    HEADER = struct.Struct("<4sHQBI")
+    """Signature, version, graine, difficulté, nombre de ticks"""
+    EVENT = struct.Struct("<IBhh")
+    """Tick, type, x, y"""
+    MAGIC = b"SFRP"
+    VERSION = 1
+
+    MOVE = 0
+    """Déplacement de la souris en (x, y)"""
+    CLICK = 1
+    """Tir du joueur"""
+    TOGGLE_SPAWN = 2
+    """Activation ou désactivation des apparitions d'ennemis"""
+
+    directory = os.path.join(
+        os.path.dirname(__file__),
+        "Data", "replays",
+    )
+
+    def __init__(self, seed: int, difficulty: int = 0):
+        self.seed = seed
+        self.difficulty = difficulty
+        """Position de la difficulté dans `Difficulty`"""
+        self.ticks = 0
+        """Durée de la partie, en ticks"""
+        self.events: list[Event] = []
+
+    def record(self, tick: int, kind: int, x: int = 0, y: int = 0) -> None:
+        """Ajoute une entrée donnée avant le tick `tick`."""
+        x, y = (max(-0x8000, min(int(value), 0x7FFF)) for value in (x, y))
+        event = Event(tick, kind, x, y)
+        events = self.events
+        if kind == self.MOVE and events and events[-1][:2] == event[:2]:
+            events[-1] = event  # Remplace le déplacement précédent
+        else:
+            events.append(event)
+        self.ticks = max(self.ticks, tick)
+
+    def by_tick(self) -> Iterator[tuple[int, list[Event]]]:
+        """Retourne chaque tick de la partie avec les entrées à
+        appliquer juste avant.
+        """
+        events = iter(self.events)
+        pending = next(events, None)
+        for tick in range(self.ticks):
+            batch = []
+            while pending is not None and pending.tick == tick:
+                batch.append(pending)
+                pending = next(events, None)
+            yield tick, batch
+
+    def dumps(self) -> bytes:
+        """Retourne l'enregistrement sous forme binaire."""
+        return self.HEADER.pack(
+            self.MAGIC, self.VERSION, self.seed, self.difficulty, self.ticks
+        ) + b"".join(self.EVENT.pack(*event) for event in self.events)
+
+    @classmethod
+    def loads(cls, data: bytes) -> Replay:
+        """Recrée un enregistrement retourné par `dumps`."""
+        magic, version, seed, difficulty, ticks = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("Not a replay, or unsupported version.")
+        replay = cls(seed, difficulty)
+        replay.ticks = ticks
+        replay.events = [
+            Event(*fields)
+            for fields in cls.EVENT.iter_unpack(data[cls.HEADER.size:])
+        ]
+        return replay
+
+    def save(self, path: str | None = None) -> str:
+        """Enregistre la partie dans un fichier et retourne son chemin.
+        Par défaut, remplace `last.sfr` dans `directory`.
+        """
+        if path is None:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, "last.sfr")
+        with open(path, "wb") as file:
+            file.write(self.dumps())
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> Replay:
+        with open(path, "rb") as file:
+            return cls.loads(file.read())
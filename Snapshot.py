@@ -0,0 +1,226 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""Permet de sauvegarder l'état d'une partie et de la reprendre."""
+
+# Documentation
+from __future__ import annotations
+from typing import NamedTuple, Type
+
+# Modules standard
+from array import array
+import os
+import struct
+
+# Modules du jeu
+from Model import GameModel, Difficulty
+from Objects.Object import Object  # type: ignore
+from Objects.Alien import Alien  # type: ignore
+from Objects.Asteroid import Asteroid  # type: ignore
+from Objects.Bullet import Bullet  # type: ignore
+from Objects.EntityStore import HAS_NUMPY  # type: ignore
+from Objects.Modifiers import Experience, Health  # type: ignore
+from Objects.Position import Dimension2D  # type: ignore
+from Objects.SpriteRegistry import SpriteRegistry  # type: ignore
+from Objects.Vaisseau import Vaisseau  # type: ignore
+
+
+class SpawnState(NamedTuple):
+    """État du controlleur de jeu sauvegardé avec la partie (voir
+    `GameController.spawn_state`).
+    """
+    ennemy_spawn_timer: int
+    asteroid_spawn_timer: int
+    enemy_spawn: bool
+    cursor_x: float
+    cursor_y: float
+
+
+class Snapshot:
+    """Sauvegarde binaire de l'état complet d'un `GameModel`, et
+    éventuellement de son controlleur (`SpawnState`).
+
+    Le fichier contient un entête (`HEADER`), l'état du controlleur
+    (`SPAWN`), l'état du générateur aléatoire (`RNG_WORDS` entiers de
+    32 bits), puis un enregistrement de taille fixe par sprite
+    (`SPRITE`), dans l'ordre du registre. Une partie reprise avec l'état
+    de son controlleur donne les mêmes ticks que la partie d'origine.
+    """
+    HEADER = struct.Struct("<4sHBQqqdddIIBd")
+    """Signature, version, difficulté, graine, score, ennemis tués,
+    distance parcourue, largeur, hauteur, position du joueur, nombre de
+    sprites, présence et valeur du prochain tirage gaussien
+    """
+    SPAWN = struct.Struct("<BIIBdd")
+    """Présence, puis champs de `SpawnState`"""
+    SPRITE = struct.Struct("<BB15d")
+    """Type, camp, état (voir `Object.get_state`) et deux attributs
+    propres au type (voir `Object.EXTRA_STATE`)
+    """
+    STATE = slice(2, 15)
+    """Champs de `SPRITE` passés à `Object.from_state`"""
+    EXTRA = slice(15, 17)
+    MAGIC = b"SFSN"
+    VERSION = 1
+
+    RNG_WORDS = 625
+    """Taille de l'état de `random.Random` (Mersenne Twister)"""
+    TYPES: tuple[Type[Object], ...] = (
+        Vaisseau, Alien, Asteroid, Bullet, Health, Experience
+    )
+    SIDES = ("neutral", "good", "evil")
+
+    directory = os.path.join(
+        os.path.dirname(__file__),
+        "Data", "snapshots",
+    )
+
+    def __init__(self):
+        raise RuntimeError("Snapshot is a static class.")
+
+    @staticmethod
+    def dumps(model: GameModel, spawn: SpawnState | None = None) -> bytes:
+        """Retourne l'état de la partie, et celui de son controlleur
+        s'il est donné, sous forme binaire.
+        """
+        _, words, gauss = model.rng.getstate()
+        sprites = list(model.sprites)
+        header = Snapshot.HEADER.pack(
+            Snapshot.MAGIC, Snapshot.VERSION,
+            list(Difficulty).index(model.difficulty), model.seed,
+            model.score, model.stats.enemies_killed,
+            model.stats.distance_traveled,
+            model.dimension.width, model.dimension.height,
+            sprites.index(model.player), len(sprites),
+            gauss is not None, gauss or 0.0
+        )
+        types = {cls: code for code, cls in enumerate(Snapshot.TYPES)}
+        sides = {side: code for code, side in enumerate(Snapshot.SIDES)}
+        padding = (0,) * (Snapshot.EXTRA.stop - Snapshot.EXTRA.start)
+        pack = Snapshot.SPRITE.pack
+        return b"".join((
+            header,
+            Snapshot.SPAWN.pack(
+                spawn is not None, *(spawn or (0, 0, False, 0.0, 0.0))
+            ),
+            array("I", words).tobytes(),
+            *(
+                pack(
+                    types[type(obj)], sides[obj.side], *obj.get_state(),
+                    *(
+                        tuple(getattr(obj, name) for name in obj.EXTRA_STATE)
+                        + padding
+                    )[:len(padding)]
+                )
+                for obj in sprites
+            )
+        ))
+
+    @staticmethod
+    def loads(
+            data: bytes, vectorize: bool = HAS_NUMPY
+    ) -> tuple[GameModel, SpawnState | None]:
+        """Recrée une partie sauvegardée par `dumps`, et retourne aussi
+        l'état de son controlleur s'il a été sauvegardé.
+
+        Raises:
+            ValueError: Si les données ne sont pas une sauvegarde, ou
+              d'une version différente.
+        """
+        if len(data) < Snapshot.HEADER.size + Snapshot.SPAWN.size:
+            raise ValueError("Not a snapshot, or unsupported version.")
+        (
+            magic, version, difficulty, seed, score, killed, distance,
+            width, height, player, count, has_gauss, gauss
+        ) = Snapshot.HEADER.unpack_from(data)
+        if magic != Snapshot.MAGIC or version != Snapshot.VERSION:
+            raise ValueError("Not a snapshot, or unsupported version.")
+        offset = Snapshot.HEADER.size
+        saved, *fields = Snapshot.SPAWN.unpack_from(data, offset)
+        spawn = None
+        if saved:
+            timer, asteroid_timer, enemy_spawn, *cursor = fields
+            spawn = SpawnState(
+                timer, asteroid_timer, bool(enemy_spawn), *cursor
+            )
+        offset += Snapshot.SPAWN.size
+        words = array("I")
+        words.frombytes(data[offset:offset + 4 * Snapshot.RNG_WORDS])
+        offset += 4 * Snapshot.RNG_WORDS
+        if len(data) != offset + count * Snapshot.SPRITE.size:
+            raise ValueError("Truncated snapshot.")
+
+        model = GameModel(
+            list(Difficulty)[difficulty], Dimension2D(width, height),
+            vectorize, seed=seed
+        )
+        model.sprites = SpriteRegistry()
+        model.score = score
+        model.stats.enemies_killed = killed
+        model.stats.distance_traveled = distance
+
+        sprites: list[Object] = []
+        types, sides = Snapshot.TYPES, Snapshot.SIDES
+        state, extra = Snapshot.STATE, Snapshot.EXTRA
+        for record in Snapshot.SPRITE.iter_unpack(data[offset:]):
+            cls = types[record[0]]
+            obj = cls.from_state(record[state], sides[record[1]])
+            # Les entiers sauvegardés comme des doubles le redeviennent
+            obj.health = _number(obj.health)
+            obj.damage = _number(obj.damage)
+            for name, value in zip(cls.EXTRA_STATE, record[extra]):
+                setattr(obj, name, _number(value))
+            sprites.append(obj)
+
+        model.player = sprites[player]
+        for obj in sprites:
+            if isinstance(obj, Experience):
+                obj.player = model.player
+        model.extend(sprites)
+        model.rng.setstate(
+            (model.rng.VERSION, tuple(words), gauss if has_gauss else None)
+        )
+        return model, spawn
+
+    @staticmethod
+    def save(
+            model: GameModel, path: str | None = None,
+            spawn: SpawnState | None = None
+    ) -> str:
+        """Sauvegarde la partie dans un fichier et retourne son chemin.
+        Par défaut, remplace `last.sfs` dans `directory`.
+        """
+        if path is None:
+            os.makedirs(Snapshot.directory, exist_ok=True)
+            path = os.path.join(Snapshot.directory, "last.sfs")
+        with open(path, "wb") as file:
+            file.write(Snapshot.dumps(model, spawn))
+        return path
+
+    @staticmethod
+    def load(
+            path: str, vectorize: bool = HAS_NUMPY
+    ) -> tuple[GameModel, SpawnState | None]:
+        with open(path, "rb") as file:
+            return Snapshot.loads(file.read(), vectorize)
+
+
+def _number(value: float) -> float:
+    """Redonne un `int` aux valeurs entières (vie, puissance, etc.)."""
+    return int(value) if value.is_integer() else value
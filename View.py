@@ -23,18 +23,24 @@ Ce module contient les classes et fonctions nécessaires à la création de la v
 
 Classe:
     - View : Classe abstraite de la vue
+    - SpritePrewarmer : Prépare les images des vues en arrière-plan
     - MenuView : Classe de la vue du menu
     - GameView : Classe de la vue du jeu
+    - NullGameView : Vue du jeu qui ne dessine rien (sans fenêtre)
     - HighscoreView : Classe de la vue des highscores
     - optionsView : Classe de la vue des options
     - ArsenalView : Classe de la vue de l'arsenal
 """
 from abc import ABC
+from typing import Iterable
+import queue
+import threading
 
-from tkinter import PhotoImage
-from PIL import Image, ImageTk  # type: ignore
+from tkinter import Misc, PhotoImage
+from PIL import Image, ImageChops, ImageTk  # type: ignore
 from functools import cache
 
+from AssetCache import AssetCache
 from Container import (
     BetterCanvas,
     BetterFrame,
@@ -49,6 +55,7 @@ from Objects.Modifiers import (  # type: ignore
     # Weapons,
     Experience,
 )
+from Objects.Pool import ObjectPool  # type: ignore
 from Objects.Position import Dimension2D  # type: ignore
 
 class View(ABC):
@@ -58,13 +65,18 @@ class View(ABC):
 
     :param this.main_frame: Frame principale de la vue
     """
+    background_width = 1200
+    background_height = 800
+    logo_width = 600
+    logo_height = 200
+
     def __init__(self, main_frame: BetterFrame):
         self.main_frame = main_frame
 
-        self.background_width = 1200
-        self.background_height = 800
-        self.logo_width = 600
-        self.logo_height = 200
+    @classmethod
+    def assets(cls) -> list[tuple[str, tuple[int, int]]]:
+        """Retourne les images (fichier et taille) utilisées par la vue."""
+        return []
 
     def draw(self):
         """Méthode abstraite de lancement de la vue"""
@@ -90,24 +102,105 @@ class View(ABC):
             content.pack_forget()
         self.main_frame.pack_forget()
 
+    CHROMA_KEY = (255, 255, 0)
+    """Couleur (jaune pur) remplacée par de la transparence"""
+    SPRITE_VERSION = 1
+    """Version de `process_sprite`, à augmenter lorsqu'il change pour
+    invalider le cache sur disque"""
+
     @staticmethod
-    @cache
-    def img_format(file: str, dimensions: tuple[int, int]) -> PhotoImage:
+    def chroma_key(img: Image.Image) -> Image.Image:
+        """Remplace les pixels jaune pur d'une image RGBA par du blanc
+        transparent.
+
+        Les comparaisons se font canal par canal avec des tables de
+        correspondance de PIL, sans boucle Python sur les pixels.
+        """
+        masks = [
+            band.point([255 if value == key else 0 for value in range(256)])
+            for band, key in zip(img.split(), View.CHROMA_KEY)
+        ]
+        # 255 seulement si les trois canaux correspondent
+        mask = ImageChops.multiply(ImageChops.multiply(*masks[:2]), masks[2])
+        img.paste((255, 255, 255, 0), mask=mask)
+        return img
+
+    @staticmethod
+    def process_sprite(file: str, dimensions: tuple[int, int]) -> Image.Image:
+        """Ouvre, redimensionne et rend transparente une image."""
         img = Image.open(file)
         img = img.resize(dimensions)
         img = img.convert('RGBA')
-        data = img.getdata()
-        
-        new_data = []
-        for item in data:
-            if item[0] == 255 and item[1] == 255 and item[2] == 0:  # finding yellow colour
-                # replacing it with a transparent value
-                new_data.append((255, 255, 255, 0))
-            else:
-                new_data.append(item)
-        
-        img.putdata(new_data)
-        return ImageTk.PhotoImage(img)
+        return View.chroma_key(img)
+
+    @staticmethod
+    @cache
+    def load_sprite(file: str, dimensions: tuple[int, int]) -> Image.Image:
+        """Retourne une image prête à afficher, depuis le cache sur
+        disque si possible. N'a pas besoin de Tk.
+        """
+        return AssetCache.load(
+            file, dimensions, View.process_sprite, View.SPRITE_VERSION
+        )
+
+    @staticmethod
+    @cache
+    def img_format(file: str, dimensions: tuple[int, int]) -> PhotoImage:
+        return ImageTk.PhotoImage(View.load_sprite(file, dimensions))
+
+
+class SpritePrewarmer:
+    """Prépare des images en arrière-plan pendant que l'interface est
+    inactive.
+
+    Un fil d'exécution séparé ouvre, redimensionne et rend transparente
+    chaque image (`View.load_sprite`). Tk ne pouvant être utilisé que
+    par son propre fil, la création des `PhotoImage` (`View.img_format`)
+    est faite dans la boucle de Tk, au fur et à mesure que les images
+    sont prêtes. Les deux étapes remplissent les caches de `View`, donc
+    les vues créées plus tard n'ont plus rien à charger.
+
+    :argument widget: Widget utilisé pour planifier le travail dans Tk
+    :argument assets: Images (fichier et taille) à préparer
+    """
+    poll_delay = 20
+    """Délai entre deux vérifications des images prêtes, en ms"""
+
+    def __init__(
+            self, widget: Misc, assets: Iterable[tuple[str, tuple[int, int]]]
+    ):
+        self.widget = widget
+        self.assets = list(dict.fromkeys(assets))  # Sans doublons
+        self.done = False
+        self._ready: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._work, daemon=True)
+
+    def start(self) -> None:
+        """Lance la préparation des images."""
+        self._thread.start()
+        self.widget.after(self.poll_delay, self._poll)
+
+    def _work(self) -> None:
+        """Prépare les images hors du fil de Tk."""
+        for file, dimensions in self.assets:
+            try:
+                View.load_sprite(file, dimensions)
+            except OSError:
+                continue  # La vue signalera l'erreur en la chargeant
+            self._ready.put((file, dimensions))
+        self._ready.put(None)
+
+    def _poll(self) -> None:
+        """Crée les PhotoImage des images prêtes, dans le fil de Tk."""
+        try:
+            while True:
+                asset = self._ready.get_nowait()
+                if asset is None:
+                    self.done = True
+                    return
+                View.img_format(*asset)
+        except queue.Empty:
+            self.widget.after(self.poll_delay, self._poll)
 
 
 class MenuView(View):
@@ -115,12 +208,26 @@ class MenuView(View):
     :argument: main_frame: Frame principale de la vue
     :param: this.title: Label du titre du jeu
     """
+    btn_width = 400
+    btn_height = 200
+
+    @classmethod
+    def assets(cls) -> list[tuple[str, tuple[int, int]]]:
+        button = (cls.btn_width, cls.btn_height)
+        return [
+            ("Graphics/background.gif",
+             (cls.background_width, cls.background_height)),
+            ("Graphics/logo.png", (cls.logo_width, cls.logo_height)),
+            ("Graphics/play.png", button),
+            ("Graphics/arsenal.png", button),
+            ("Graphics/options.png", button),
+            ("Graphics/highscores.png", button),
+            ("Graphics/quit.png", button),
+        ]
+
     def __init__(self, main_frame: BetterFrame):
         super().__init__(main_frame)
 
-        self.btn_width = 400
-        self.btn_height = 200
-
         self.background_img = self.img_format(
             "Graphics/background.gif", (self.background_width,
                                         self.background_height)
@@ -188,16 +295,30 @@ class GameView(View):
 
     :param this.main_frame: Frame principale de la vue
     """
+    player_width = 100
+    player_height = 100
+    alien_width = 50
+    alien_height = 50
+    bullet_width = 50
+    bullet_height = 50
+
+    @classmethod
+    def assets(cls) -> list[tuple[str, tuple[int, int]]]:
+        alien = (cls.alien_width, cls.alien_height)
+        bullet = (cls.bullet_width, cls.bullet_height)
+        return [
+            ("Graphics/background.gif",
+             (cls.background_width, cls.background_height)),
+            ("Graphics/player.png", (cls.player_width, cls.player_height)),
+            *((f"Graphics/alien{i}.png", alien) for i in range(1, 6)),
+            ("Graphics/bullet.png", bullet),
+            ("Graphics/bulletAlien.png", bullet),
+            ("Graphics/asteroid.png", bullet),
+        ]
+
     def __init__(self, main_frame: BetterFrame):
         super().__init__(main_frame)
 
-        self.player_width = 100
-        self.player_height = 100
-        self.alien_width = 50
-        self.alien_height = 50 
-        self.bullet_width = 50
-        self.bullet_height = 50
-
         self.canvas = BetterCanvas(
             self.main_frame, 0.5, 0.5,
             width=self.background_width,
@@ -267,6 +388,20 @@ class GameView(View):
             text = "LIFE: 100", font="Fixedsys 50 bold",fill="white"
         )
 
+        self._positions: dict[int, tuple[float, float]] = {}
+        """Dernière position envoyée au canvas pour chaque sprite"""
+        self._pending: dict[int, tuple[float, float]] = {}
+        """Déplacements qui seront envoyés au prochain `flush`"""
+        self._info: tuple[str, str] = ("SCORE: 0", "LIFE: 100")
+
+        # Les sprites supprimés sont cachés puis réutilisés
+        self._images = ObjectPool(self._create_image, self._reuse_image)
+        self._rectangles = ObjectPool(
+            self._create_rectangle, self._reuse_rectangle
+        )
+        self._item_pools: dict[int, ObjectPool] = {}
+        """Réserve à laquelle rendre chaque sprite supprimé"""
+
     @property
     def dimension(self) -> Dimension2D:
         """Retourne la taille du canvas de jeu."""
@@ -280,35 +415,88 @@ class GameView(View):
         self.canvas.place(relx=0.5, rely=0.5, anchor="center")
         super().draw()
 
+    def _create_image(self, image, x, y) -> int:
+        return self.canvas.create_image(x, y, image=image)
+
+    def _reuse_image(self, sprite, image, x, y) -> None:
+        self.canvas.itemconfigure(sprite, image=image, state="normal")
+        self.canvas.coords(sprite, x, y)
+
+    def _create_rectangle(self, fill, x0, y0, x1, y1) -> int:
+        return self.canvas.create_rectangle(x0, y0, x1, y1, fill=fill)
+
+    def _reuse_rectangle(self, sprite, fill, x0, y0, x1, y1) -> None:
+        self.canvas.itemconfigure(sprite, fill=fill, state="normal")
+        self.canvas.coords(sprite, x0, y0, x1, y1)
+
+    def _spawn(self, pool: ObjectPool, *args) -> int:
+        """Crée un sprite, ou réutilise un sprite supprimé."""
+        sprite = pool.acquire(*args)
+        self._item_pools[sprite] = pool
+        return sprite
+
     def spawnPlayer(self, x, y) -> int:
         return self.canvas.create_image(x, y, image=self.player_img)
 
     def spawnAlien(self, alien_type: int, x, y) -> int:
-        return self.canvas.create_image(
-                x, y,
-                image=self.aliensType[alien_type]
-        )
+        return self._spawn(self._images, self.aliensType[alien_type], x, y)
     
     def spawnBullet(self, x, y) -> int:
-        return self.canvas.create_image(x, y, image=self.bullet_img)
+        return self._spawn(self._images, self.bullet_img, x, y)
 
     def spawnBulletAlien(self, x, y) -> int:
-        return self.canvas.create_image(x, y, image=self.bullet_alien_img)
+        return self._spawn(self._images, self.bullet_alien_img, x, y)
 
     def spawnAsteroid(self, x, y) -> int:
-        return self.canvas.create_image(x, y, image=self.asteroid_img)
+        return self._spawn(self._images, self.asteroid_img, x, y)
 
     def spawnModifier(self, mod: Modifiers) -> int:
         point1, point2 = mod.points
-        return self.canvas.create_rectangle(
-            *point1, *point2, fill=self.mod_colors[type(mod)]
+        return self._spawn(
+            self._rectangles, self.mod_colors[type(mod)], *point1, *point2
         )
 
     def moveSprite(self, sprite, x, y):
-        self.canvas.moveto(sprite, x, y)
+        """Prévoit le déplacement d'un sprite. Rien n'est envoyé au
+        canvas avant `flush`, et un sprite qui n'a pas bougé est ignoré.
+        """
+        if self._positions.get(sprite) != (x, y):
+            self._pending[sprite] = (x, y)
+        else:
+            self._pending.pop(sprite, None)
+
+    def flush(self):
+        """Envoie tous les déplacements prévus au canvas en un seul
+        script Tcl, plutôt qu'un appel à `canvas.moveto` par sprite.
+        """
+        if not self._pending:
+            return
+        canvas = str(self.canvas)
+        self.canvas.tk.eval("\n".join(
+            f"{canvas} moveto {sprite} {x!r} {y!r}"
+            for sprite, (x, y) in self._pending.items()
+        ))
+        self._positions.update(self._pending)
+        self._pending.clear()
 
     def deleteSprite(self, sprite):
-        self.canvas.delete(sprite)
+        """Cache un sprite pour le réutiliser, ou le supprime si sa
+        réserve est pleine.
+        """
+        self._positions.pop(sprite, None)
+        self._pending.pop(sprite, None)
+        pool = self._item_pools.pop(sprite, None)
+        if pool is not None and pool.release(sprite):
+            self.canvas.itemconfigure(sprite, state="hidden")
+        else:
+            self.canvas.delete(sprite)
+
+    def pool_stats(self) -> dict[str, dict[str, float]]:
+        """Retourne les statistiques des réserves de sprites."""
+        return {
+            "images": self._images.stats(),
+            "rectangles": self._rectangles.stats(),
+        }
 
     def isVisible(self, sprite):
         # If the sprite is not visible (out of the window), return False
@@ -322,8 +510,76 @@ class GameView(View):
         return 0 < x < self.dimension.width and 0 < y < self.dimension.height
 
     def update_info(self, score: int, life: float) -> None:
-        self.canvas.itemconfig(self.score_id, text=f"SCORE: {score}")
-        self.canvas.itemconfig(self.life_id, text=f"LIFE: {life:.1f}")
+        score_text, life_text = f"SCORE: {score}", f"LIFE: {life:.1f}"
+        if score_text != self._info[0]:
+            self.canvas.itemconfig(self.score_id, text=score_text)
+        if life_text != self._info[1]:
+            self.canvas.itemconfig(self.life_id, text=life_text)
+        self._info = (score_text, life_text)
+
+
+class NullGameView:
+    """Vue du jeu compatible avec GameView qui ne dessine rien.
+
+    N'utilise pas Tk et ne garde aucun sprite: elle ne fait que donner
+    un identifiant à chacun. Utilisée pour faire tourner la partie sans
+    fenêtre.
+    """
+    background_width = View.background_width
+    background_height = View.background_height
+
+    def __init__(self):
+        self.canvas = None
+        self._next_id = 1
+
+    @property
+    def dimension(self) -> Dimension2D:
+        """Retourne la taille du canvas de jeu."""
+        return Dimension2D(self.background_width, self.background_height)
+
+    def draw(self):
+        pass
+
+    def destroy(self):
+        pass
+
+    def _spawn(self) -> int:
+        sprite = self._next_id
+        self._next_id += 1
+        return sprite
+
+    def spawnPlayer(self, x, y) -> int:
+        return self._spawn()
+
+    def spawnAlien(self, alien_type: int, x, y) -> int:
+        return self._spawn()
+
+    def spawnBullet(self, x, y) -> int:
+        return self._spawn()
+
+    def spawnBulletAlien(self, x, y) -> int:
+        return self._spawn()
+
+    def spawnAsteroid(self, x, y) -> int:
+        return self._spawn()
+
+    def spawnModifier(self, mod: Modifiers) -> int:
+        return self._spawn()
+
+    def moveSprite(self, sprite, x, y):
+        pass
+
+    def flush(self):
+        pass
+
+    def deleteSprite(self, sprite):
+        pass
+
+    def pool_stats(self) -> dict[str, dict[str, float]]:
+        return {}
+
+    def update_info(self, score: int, life: float) -> None:
+        pass
 
 
 class HighscoreView(View):
@@ -333,12 +589,23 @@ class HighscoreView(View):
 
     :param this.main_frame: Frame principale de la vue
     """
+    btn_width = 400
+    btn_height = 200
+    rows = 9
+    """Nombre de scores affichés"""
+
+    @classmethod
+    def assets(cls) -> list[tuple[str, tuple[int, int]]]:
+        return [
+            ("Graphics/logo.png", (cls.logo_width, cls.logo_height)),
+            ("Graphics/background.gif",
+             (cls.background_width, cls.background_height)),
+            ("Graphics/menu.png", (cls.btn_width, cls.btn_height)),
+        ]
+
     def __init__(self, main_frame: BetterFrame):
         super().__init__(main_frame)
 
-        self.btn_width = 400
-        self.btn_height = 200
-        
         self.logo_img = self.img_format(
             "Graphics/logo.png", (self.logo_width, self.logo_height)
         )
@@ -382,7 +649,7 @@ class HighscoreView(View):
                 font="Fixedsys 20 bold",fill="white"
             )
             i+=1
-            if i==9:
+            if i==self.rows:
                 break
 
 
@@ -393,15 +660,30 @@ class OptionsView(View):
 
     :param this.main_frame: Frame principale de la vue
     """
-    
+    btn_width = 300
+    btn_height = 150
+    btn_big_width = 400
+    btn_big_height = 200
+
+    @classmethod
+    def assets(cls) -> list[tuple[str, tuple[int, int]]]:
+        button = (cls.btn_width, cls.btn_height)
+        big_button = (cls.btn_big_width, cls.btn_big_height)
+        return [
+            ("Graphics/logo.png", (cls.logo_width, cls.logo_height)),
+            ("Graphics/background.gif",
+             (cls.background_width, cls.background_height)),
+            ("Graphics/easy.png", button),
+            ("Graphics/intermediate.png", button),
+            ("Graphics/hard.png", button),
+            ("Graphics/small.png", big_button),
+            ("Graphics/big.png", big_button),
+            ("Graphics/menu.png", big_button),
+        ]
+
     def __init__(self, main_frame: BetterFrame):
         super().__init__(main_frame)
 
-        self.btn_width = 300
-        self.btn_height = 150
-        self.btn_big_width = 400
-        self.btn_big_height = 200
-
         self.logo_img = self.img_format(
             "Graphics/logo.png", (self.logo_width, self.logo_height)
         )
@@ -487,12 +769,23 @@ class GameOverView(View):
 
     :param this.main_frame: Frame principale de la vue
     """
+
+    @classmethod
+    def assets(cls) -> list[tuple[str, tuple[int, int]]]:
+        return [
+            ("Graphics/logo.png", (cls.logo_width, cls.logo_height)),
+            ("Graphics/background.gif",
+             (cls.background_width, cls.background_height)),
+        ]
+
     def __init__(self, main_frame: BetterFrame):
         super().__init__(main_frame)
 
         self.entry_width = 400
         
         self.score = 0
+        self.error_text = None
+        """Message affiché par `show_error`"""
 
         self.logo_img = self.img_format(
             "Graphics/logo.png", (self.logo_width, self.logo_height)
@@ -532,11 +825,30 @@ class GameOverView(View):
         self.name_entry.place(relx = 0.3,y = self.background_height*0.7)
         self.name_entry.focus_set()
 
-    def show_score(self, score:int):
+    def show_score(self, score:int, rank:int = None, percentile:float = None):
         self.GameOver_title = self.main_canvas.create_text(
             self.background_width/2, self.background_height*0.45,
             text = str(score) + " pts", font="Fixedsys 50 bold",fill="white"
             )
+        if rank is not None:
+            text = f"RANK #{rank:,}"
+            if percentile is not None:
+                text += f" - BETTER THAN {percentile:.0f}% OF GAMES"
+            self.rank_text = self.main_canvas.create_text(
+                self.background_width/2, self.background_height*0.53,
+                text = text, font="Fixedsys 20", fill="white"
+                )
+
+    def show_error(self, message: str) -> None:
+        """Affiche un message d'erreur sous le nom, en remplaçant le
+        précédent."""
+        if self.error_text is not None:
+            self.main_canvas.delete(self.error_text)
+        self.error_text = self.main_canvas.create_text(
+            self.background_width/2, self.background_height*0.85,
+            text = message, font="Fixedsys 16", fill="red",
+            width = self.background_width*0.8
+            )
 
 
 
@@ -549,5 +861,4 @@ class ArsenalView(View):
     def __init__(self, main_frame: BetterFrame):
         super().__init__(main_frame)
 
-
     
\ No newline at end of file
@@ -0,0 +1,374 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""Suite de mesures des chemins critiques du jeu: modèle, collisions,
+`Vecteur`/`Point`, chargement des images et highscores.
+
+Les charges sont générées à partir d'une graine fixe. Les résultats
+(meilleur temps par opération, en secondes) sont écrits en JSON et
+peuvent être comparés à une référence enregistrée plus tôt: une mesure
+plus lente que la référence au-delà du seuil est une régression, et le
+programme se termine alors avec le code 1.
+
+Utilisation (depuis la racine du projet):
+    python -m benchmarks [--only model collisions] [--output FILE]
+    cp Data/benchmarks/latest.json baseline.json
+    python -m benchmarks --compare baseline.json [--threshold 0.15]
+"""
+from __future__ import annotations
+from typing import Any, Callable, Iterator
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+from AssetCache import AssetCache
+from Highscore import HighScore
+from Model import GameModel, Difficulty
+from View import View, HighscoreView
+from Objects.AliveObject import AliveObject  # type: ignore
+from Objects.Alien import Alien  # type: ignore
+from Objects.Asteroid import Asteroid  # type: ignore
+from Objects.Bullet import Bullet  # type: ignore
+from Objects.EntityStore import HAS_NUMPY  # type: ignore
+from Objects.Position import Point, Vecteur  # type: ignore
+
+from benchmarks.bench_collisions import populate
+from benchmarks.bench_sprites import SPRITES
+
+Results = Iterator[tuple[str, "float | None"]]
+"""Nom de chaque mesure et son temps par opération (None si sautée)"""
+
+VERSION = 1
+"""Version du format JSON des résultats"""
+OUTPUT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "Data", "benchmarks", "latest.json",
+)
+
+
+def measure(
+        func: Callable[[Any], Any], repeat: int,
+        setup: Callable[[], Any] = lambda: None, number: int = 1
+) -> float:
+    """Retourne le meilleur temps par appel de `func`, en secondes.
+    `setup` prépare l'argument de `func` avant chaque répétition, hors
+    du temps mesuré.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            func(arg)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def modes() -> list[tuple[str, bool]]:
+    """Versions du modèle à mesurer: vectorisée seulement si NumPy est
+    installé.
+    """
+    return [("scalar", False)] + ([("numpy", True)] if HAS_NUMPY else [])
+
+
+def model_of(size: int, vectorize: bool, seed: int) -> GameModel:
+    model = GameModel(Difficulty.NORMAL, vectorize=vectorize, seed=seed)
+    populate(model, size, seed)
+    return model
+
+
+def bench_model(args: argparse.Namespace) -> Results:
+    """`GameModel.update`: déplacement, retrait et collisions."""
+    for size in args.sizes:
+        for mode, vectorize in modes():
+            yield f"model.update[{size},{mode}]", measure(
+                lambda model: model.update(), args.repeat,
+                lambda: model_of(size, vectorize, args.seed)
+            )
+
+
+def bench_collisions(args: argparse.Namespace) -> Results:
+    """`GameModel.get_collisions` avec un type et avec un objet."""
+    for size in args.sizes:
+        for mode, vectorize in modes():
+            model = model_of(size, vectorize, args.seed)
+            yield f"collisions.type[{size},{mode}]", measure(
+                lambda _: model.get_collisions(Bullet, AliveObject),
+                args.repeat
+            )
+            yield f"collisions.object[{size},{mode}]", measure(
+                lambda _: model.get_collisions(
+                    model.player, (Alien, Asteroid)
+                ),
+                args.repeat, number=10
+            )
+
+
+def bench_position(args: argparse.Namespace) -> Results:
+    """Opérations de `Vecteur` et de `Point`."""
+    rng = random.Random(args.seed)
+    v, w = Vecteur(rng.random(), rng.random()), Vecteur(rng.random(), 1)
+    p, q = Point(rng.random(), rng.random()), Point(rng.random(), 1)
+    operations = {
+        "vecteur_add": lambda _: v + w,
+        "vecteur_scale": lambda _: v * 0.5,
+        "vecteur_norme": lambda _: v.norme,
+        "point_add": lambda _: p + v,
+        "point_sub": lambda _: p - q,
+    }
+    for name, operation in operations.items():
+        yield f"position.{name}", measure(
+            operation, args.repeat, number=args.calls
+        )
+
+
+def bench_view(args: argparse.Namespace) -> Results:
+    """Préparation de toutes les images des vues, sans cache (cold)
+    et avec le cache sur disque (warm). `View.img_format` a besoin de
+    Tk et n'est mesurée que si une fenêtre peut être créée.
+    """
+    try:
+        root: tk.Tk | None = tk.Tk()
+        root.withdraw()
+    except tk.TclError:
+        root = None
+
+    def load_all(loader: Callable[[str, tuple[int, int]], Any]) -> None:
+        for file, dimensions in SPRITES:
+            loader(file, dimensions)
+
+    directory = AssetCache.directory
+    with tempfile.TemporaryDirectory() as temp:
+        def cold() -> None:
+            View.load_sprite.cache_clear()
+            View.img_format.cache_clear()
+            AssetCache.directory = tempfile.mkdtemp(dir=temp)
+
+        def warm() -> None:
+            View.load_sprite.cache_clear()
+            View.img_format.cache_clear()
+
+        try:
+            for name, setup in (("cold", cold), ("warm", warm)):
+                yield f"view.load_sprite[{name}]", measure(
+                    lambda _: load_all(View.load_sprite), args.repeat, setup
+                )
+                if root is None:
+                    yield f"view.img_format[{name}]", None
+                else:
+                    yield f"view.img_format[{name}]", measure(
+                        lambda _: load_all(View.img_format), args.repeat,
+                        setup
+                    )
+        finally:
+            AssetCache.directory = directory
+            View.load_sprite.cache_clear()
+            View.img_format.cache_clear()
+            if root is not None:
+                root.destroy()
+
+
+def bench_highscore(args: argparse.Namespace) -> Results:
+    """`HighScore.save_score`, `HighScore.get_scores` et
+    `HighScore.get_page` (première page et page du milieu) dans une
+    base temporaire de `rows` scores.
+    """
+    rng = random.Random(args.seed)
+    database = HighScore.database
+    HighScore.close()
+    with tempfile.TemporaryDirectory() as temp:
+        try:
+            for rows in args.rows:
+                HighScore.close()
+                HighScore.database = os.path.join(temp, f"{rows}.db")
+                con = HighScore.connect()
+                with con:
+                    con.executemany(HighScore.INSERT, (
+                        (f"player{rng.randrange(1000)}", rng.randrange(10000))
+                        for _ in range(rows)
+                    ))
+
+                yield f"highscore.save_score[{rows}]", measure(
+                    lambda _: HighScore.save_score(
+                        "bench", rng.randrange(10000)
+                    ),
+                    args.repeat, number=20
+                )
+                for name, offset in (("top", 0), ("middle", rows // 2)):
+                    yield f"highscore.get_scores[{rows},{name}]", measure(
+                        lambda _: HighScore.get_scores(
+                            limit=HighscoreView.rows, offset=offset
+                        ),
+                        args.repeat, number=10
+                    )
+                # Pagination par clé, utilisée par le tableau des scores
+                middle = con.execute(
+                    f"SELECT Score, ID FROM HighScores "
+                    f"ORDER BY {HighScore.ORDERS['Score']} LIMIT 1 OFFSET ?",
+                    (rows // 2,)
+                ).fetchone()
+                for name, after in (("top", None), ("middle", tuple(middle))):
+                    yield f"highscore.get_page[{rows},{name}]", measure(
+                        lambda _: HighScore.get_page(
+                            limit=HighscoreView.rows, after=after
+                        ),
+                        args.repeat, number=10
+                    )
+        finally:
+            HighScore.close()
+            HighScore.database = database
+
+
+GROUPS: dict[str, Callable[[argparse.Namespace], Results]] = {
+    "model": bench_model,
+    "collisions": bench_collisions,
+    "position": bench_position,
+    "view": bench_view,
+    "highscore": bench_highscore,
+}
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Effectue les mesures demandées et retourne le document JSON."""
+    results: dict[str, float | None] = {}
+    for group in (group for group in GROUPS if group in args.only):
+        for name, seconds in GROUPS[group](args):
+            results[name] = seconds
+            print(f"{name:<40} {format_time(seconds):>12}", flush=True)
+    return {
+        "version": VERSION,
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": HAS_NUMPY,
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "results": results,
+    }
+
+
+def compare(
+        results: dict[str, float | None], baseline: dict[str, float | None],
+        threshold: float
+) -> list[str]:
+    """Affiche chaque mesure avec celle de la référence et retourne les
+    noms des régressions (plus lentes que `1 + threshold` fois la
+    référence).
+    """
+    regressions = []
+    print(f"{'':<40} {'référence':>12} {'actuel':>12} {'ratio':>8}")
+    for name, seconds in results.items():
+        base = baseline.get(name)
+        if seconds is None or not base:
+            ratio, flag = "-", ""
+        else:
+            change = seconds / base
+            ratio = f"{change:.2f}"
+            if change > 1 + threshold:
+                flag = "  RÉGRESSION"
+                regressions.append(name)
+            elif change < 1 / (1 + threshold):
+                flag = "  amélioration"
+            else:
+                flag = ""
+        print(
+            f"{name:<40} {format_time(base):>12} {format_time(seconds):>12}"
+            f" {ratio:>8}{flag}"
+        )
+    return regressions
+
+
+def format_time(seconds: float | None) -> str:
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--only", nargs="+", choices=list(GROUPS), default=list(GROUPS),
+        help="Groupes de mesures à effectuer (tous par défaut)"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 1000, 10000],
+        help="Nombres de sprites pour le modèle et les collisions"
+    )
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[10_000, 1_000_000],
+        help="Nombres de scores dans la base des highscores"
+    )
+    parser.add_argument(
+        "--calls", type=int, default=100_000,
+        help="Appels par mesure des opérations de Vecteur et Point"
+    )
+    parser.add_argument(
+        "--output", metavar="FILE", default=OUTPUT,
+        help="Fichier JSON des résultats (par défaut %(default)s)"
+    )
+    parser.add_argument(
+        "--compare", metavar="BASELINE",
+        help="Compare les résultats à un fichier JSON de référence"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.15,
+        help="Ralentissement toléré avant de signaler une régression"
+    )
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:  # Lu avant les mesures, pour échouer tôt
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        if baseline.get("version") != VERSION:
+            parser.error(f"{args.compare}: unsupported results version")
+
+    document = run(args)
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as file:
+        json.dump(document, file, indent=2)
+    print(f"Résultats écrits dans {args.output}")
+
+    if baseline is None:
+        return 0
+    print()
+    regressions = compare(
+        document["results"], baseline["results"], args.threshold
+    )
+    if regressions:
+        print(f"{len(regressions)} régression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""Mesure le coût de `GameModel.get_collisions(Bullet, AliveObject)`
+avec la grille de hachage spatial et avec le test vectorisé (si NumPy
+est installé), comparé à la comparaison de toutes les paires.
+
+Utilisation (depuis la racine du projet):
+    python -m benchmarks.bench_collisions [--sizes 100 1000 10000]
+"""
+import argparse
+import random
+import time
+
+from Model import GameModel, Difficulty
+from Objects.Collisions import HAS_NUMPY  # type: ignore
+from Objects.AliveObject import AliveObject  # type: ignore
+from Objects.Alien import Alien  # type: ignore
+from Objects.Asteroid import Asteroid  # type: ignore
+from Objects.Bullet import Bullet  # type: ignore
+from Objects.Position import Point, Vecteur  # type: ignore
+
+
+def populate(model: GameModel, count: int, seed: int = 0) -> None:
+    """Remplit le modèle de `count` entités, moitié balles et moitié
+    ennemis, réparties sur un écran de 1200x800.
+    """
+    rng = random.Random(seed)
+    for i in range(count):
+        position = Point(rng.random() * 1200, rng.random() * 800)
+        if i % 2:
+            model.add(
+                Bullet(position, 10, Vecteur(0, -15), "good")
+            )
+        elif i % 4:
+            model.add(Alien(position))
+        else:
+            model.add(Asteroid(position))
+
+
+def brute_force(model: GameModel) -> list:
+    """Implémentation de référence: toutes les paires sont testées."""
+    victims = model.get_all_of(AliveObject)
+    return [
+        (bullet, victim)
+        for bullet in model.get_all_of(Bullet)
+        for victim in victims
+        if bullet.collides(victim)
+        and bullet is not victim
+    ]
+
+
+def measure(func, repeat: int) -> float:
+    """Retourne le meilleur temps d'exécution, en secondes."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 1000, 10000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--brute-max", type=int, default=2000,
+        help="Taille maximale pour laquelle la version naïve est mesurée."
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'entités':>8} {'paires':>8} {'grille (ms)':>12} "
+        f"{'numpy (ms)':>12} {'naïf (ms)':>12}"
+    )
+    for size in args.sizes:
+        model = GameModel(Difficulty.NORMAL)
+        populate(model, size)
+        collide = lambda: model.get_collisions(Bullet, AliveObject)
+
+        model.vectorize = False
+        pairs = collide()
+        grid = f"{measure(collide, args.repeat) * 1000:12.2f}"
+        if HAS_NUMPY:
+            model.vectorize = True
+            assert pairs == collide(), "Résultats différents"
+            vectorized = f"{measure(collide, args.repeat) * 1000:12.2f}"
+        else:
+            vectorized = f"{'-':>12}"
+        if size <= args.brute_max:
+            assert pairs == brute_force(model), "Résultats différents"
+            naive = f"{measure(lambda: brute_force(model), args.repeat) * 1000:12.2f}"
+        else:
+            naive = f"{'-':>12}"
+        print(f"{size:>8} {len(pairs):>8} {grid} {vectorized} {naive}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""Compare le déplacement des `Experience` une par une
+(`Experience.update`) et en un seul passage vectorisé
+(`EntityStore.step` puis `EntityStore.attract`), et vérifie que les
+résultats sont identiques à la précision près.
+
+Utilisation (depuis la racine du projet):
+    python -m benchmarks.bench_experience [--sizes 100 1000 10000]
+"""
+import argparse
+import random
+import time
+
+from Objects.EntityStore import EntityStore, HAS_NUMPY  # type: ignore
+from Objects.Modifiers import Experience  # type: ignore
+from Objects.Position import Point  # type: ignore
+from Objects.Vaisseau import Vaisseau  # type: ignore
+
+
+def make_orbs(count: int, player: Vaisseau, seed: int = 0) -> list[Experience]:
+    random.seed(seed)
+    return [
+        Experience(
+            Point(random.random() * 1200, random.random() * 800), 1, player
+        )
+        for _ in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 1000, 10000]
+    )
+    parser.add_argument("--ticks", type=int, default=50)
+    args = parser.parse_args()
+    if not HAS_NUMPY:
+        raise SystemExit("NumPy est requis pour ce test.")
+
+    print(
+        f"{'orbes':>8} {'une à une (ms)':>15} {'vectorisé (ms)':>15} "
+        f"{'écart max':>10}"
+    )
+    player = Vaisseau(Point(590, 750))
+    x, y = player.coords
+    centre = (x + player.width / 2, y + player.height / 2)
+    for size in args.sizes:
+        single = make_orbs(size, player)
+        start = time.perf_counter()
+        for _ in range(args.ticks):
+            for orb in single:
+                orb.update()
+        single_time = (time.perf_counter() - start) / args.ticks
+
+        store = EntityStore()
+        batched = make_orbs(size, player)
+        for orb in batched:
+            store.bind(orb)
+        start = time.perf_counter()
+        for _ in range(args.ticks):
+            store.step()
+            store.attract(*centre)
+        batched_time = (time.perf_counter() - start) / args.ticks
+
+        error = max(
+            abs(a - b)
+            for one, other in zip(single, batched)
+            for a, b in zip(
+                (*one.coords, *one.velocity), (*other.coords, *other.velocity)
+            )
+        )
+        print(
+            f"{size:>8} {single_time * 1000:>15.2f} "
+            f"{batched_time * 1000:>15.2f} {error:>10.2g}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""Compte les `Point` et `Vecteur` créés par appel et mesure le temps de
+`Object.update`, `Vaisseau.move_to` et `Experience.update`, comparés à
+leur ancienne version basée sur les opérations de `Vecteur`, et
+vérifie que les résultats sont identiques.
+
+Utilisation (depuis la racine du projet):
+    python -m benchmarks.bench_kinematics [--calls 100000]
+"""
+import argparse
+import time
+from collections import Counter
+
+from Objects.Bullet import Bullet  # type: ignore
+from Objects.Modifiers import Experience  # type: ignore
+from Objects.Object import Object  # type: ignore
+from Objects.Position import Point, Vecteur  # type: ignore
+from Objects.Vaisseau import Vaisseau  # type: ignore
+
+CREATED: Counter = Counter()
+"""Nombre d'objets créés par classe pendant le décompte"""
+
+
+def legacy_update(obj: Object) -> None:
+    """Ancienne version de `Object.update`."""
+    sp = obj.speed
+    obj.speed += obj.acceleration
+    if obj.speed > sp and obj.acceleration < 0:
+        obj.speed = 0
+    obj.position += obj.velocity
+    obj._update_points()
+
+
+def legacy_move_to(ship: Vaisseau, destination: Point) -> None:
+    """Ancienne version de `Vaisseau.move_to`."""
+    movevec = destination - ship.position
+    if movevec.norme:
+        movevec = movevec.asnorm(min(movevec.norme, ship.max_speed))
+        ship.position += movevec
+
+
+def legacy_experience_update(exp: Experience) -> None:
+    """Ancienne version de `Experience.update`."""
+    legacy_update(exp)
+    destination = exp.player.center
+    movevec = destination - exp.position
+    a = destination - exp.center
+    b = a.norme
+    exp.velocity += movevec.asnorm(75 / b)
+
+
+def make_bullet() -> Bullet:
+    bullet = Bullet(Point(600, 400), 25, Vecteur(3, -15), "good")
+    bullet.acceleration = -0.1
+    return bullet
+
+
+def make_ship() -> Vaisseau:
+    return Vaisseau(Point(590, 750))
+
+
+PLAYER = make_ship()
+TARGETS = [Point(200, 700), Point(1000, 720), Point(593.5, 751.25)]
+
+
+def make_experience() -> Experience:
+    exp = Experience(Point(300, 100), 3, PLAYER)
+    exp.velocity = Vecteur(0, 4.5)
+    return exp
+
+
+CASES = {
+    "Object.update": (
+        make_bullet,
+        lambda bullet, i: legacy_update(bullet),
+        lambda bullet, i: bullet.update(),
+    ),
+    "Vaisseau.move_to": (
+        make_ship,
+        lambda ship, i: legacy_move_to(ship, TARGETS[i % 3]),
+        lambda ship, i: ship.move_to(TARGETS[i % 3]),
+    ),
+    "Experience.update": (
+        make_experience,
+        lambda exp, i: legacy_experience_update(exp),
+        lambda exp, i: exp.update(),
+    ),
+}
+"""Fabrique de l'objet, ancienne version et nouvelle version (appelées
+avec l'objet et le numéro de l'appel)"""
+
+
+def state(obj: Object) -> tuple:
+    return (*obj.coords, *obj.bounds, *obj.velocity)
+
+
+def count_created(make, func) -> int:
+    """Retourne le nombre de `Point` et `Vecteur` créés par un appel."""
+    obj = make()
+    point_init, vecteur_new = Point.__init__, Vecteur.__new__
+
+    def counting_init(self, *args):
+        CREATED[Point] += 1
+        point_init(self, *args)
+
+    def counting_new(cls, *args):
+        CREATED[Vecteur] += 1
+        return complex.__new__(cls, *args)
+
+    CREATED.clear()
+    Point.__init__, Vecteur.__new__ = counting_init, counting_new
+    try:
+        func(obj, 0)
+    finally:
+        Point.__init__, Vecteur.__new__ = point_init, vecteur_new
+    return sum(CREATED.values())
+
+
+def measure(make, func, calls: int) -> float:
+    """Retourne le temps moyen d'un appel, en microsecondes."""
+    obj = make()
+    start = time.perf_counter()
+    for i in range(calls):
+        func(obj, i)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(
+        f"{'fonction':>18} {'objets avant':>13} {'objets après':>13} "
+        f"{'avant (µs)':>11} {'après (µs)':>11}"
+    )
+    for name, (make, legacy, current) in CASES.items():
+        old, new = make(), make()
+        for i in range(200):
+            legacy(old, i)
+            current(new, i)
+            assert state(old) == state(new), f"{name}: résultats différents"
+        print(
+            f"{name:>18} {count_created(make, legacy):>13} "
+            f"{count_created(make, current):>13} "
+            f"{measure(make, legacy, args.calls):>11.2f} "
+            f"{measure(make, current, args.calls):>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""Mesure la mémoire occupée par entité du jeu avec les `__slots__`,
+comparée à l'ancienne disposition où chaque objet avait un `__dict__`,
+une `Dimension2D`, deux `Point` et un `Vecteur`.
+
+Utilisation (depuis la racine du projet):
+    python -m benchmarks.bench_memory [--count 10000]
+"""
+import argparse
+import gc
+import tracemalloc
+
+from Objects.Alien import Alien  # type: ignore
+from Objects.Asteroid import Asteroid  # type: ignore
+from Objects.Bullet import Bullet  # type: ignore
+from Objects.Modifiers import Experience  # type: ignore
+from Objects.Position import Point, Vecteur, Dimension2D  # type: ignore
+from Objects.Vaisseau import Vaisseau  # type: ignore
+
+
+class LegacyPoint:
+    """`Point` sans `__slots__`."""
+    def __init__(self, x: float, y: float):
+        self.x = x
+        self.y = y
+
+
+class LegacyObject:
+    """Ancienne disposition en mémoire d'un `Object`: les mêmes
+    attributs que l'ancien `Object.__init__`, dans le même ordre.
+    """
+    def __init__(
+            self,
+            position: LegacyPoint,
+            width: float,
+            height: float,
+            velocity: Vecteur
+    ):
+        self.dimension = Dimension2D(width, height)
+        self.position = position
+        x0, y0 = position.x - width / 2, position.y - height / 2
+        self.points = (
+            LegacyPoint(x0, y0), LegacyPoint(x0 + width, y0 + height)
+        )
+        self.velocity = velocity
+        self.acceleration = 0
+        self.id = 0
+        self.health = 0
+        self.damage = 0
+        self.side = "neutral"
+
+
+class LegacyAlien(LegacyObject):
+    """Ancienne disposition en mémoire d'un `Alien`."""
+    def __init__(self, position: LegacyPoint):
+        super().__init__(position, 25, 25, Vecteur(0, 5))
+        self.firepower = 10
+
+
+class LegacyExperience(LegacyObject):
+    """Ancienne disposition en mémoire d'une `Experience`."""
+    def __init__(self, position: LegacyPoint, value: int, player: Vaisseau):
+        super().__init__(position, 10, 10, Vecteur(0, 5.5))
+        self.value = value
+        self.player = player
+        self.acceleration = -0.1
+
+
+PLAYER = Vaisseau(Point(600, 700))
+
+KINDS = {
+    "Bullet": (
+        lambda x, y: LegacyObject(
+            LegacyPoint(x, y), 5, 5, Vecteur(0, -15)
+        ),
+        lambda x, y: Bullet(Point(x, y), 25, Vecteur(0, -15), "good"),
+    ),
+    "Alien": (
+        lambda x, y: LegacyAlien(LegacyPoint(x, y)),
+        lambda x, y: Alien(Point(x, y)),
+    ),
+    "Asteroid": (
+        lambda x, y: LegacyObject(LegacyPoint(x, y), 5, 5, Vecteur(0, 7)),
+        lambda x, y: Asteroid(Point(x, y)),
+    ),
+    "Experience": (
+        lambda x, y: LegacyExperience(LegacyPoint(x, y), 3, PLAYER),
+        lambda x, y: Experience(Point(x, y), 3, PLAYER),
+    ),
+}
+"""Constructeurs (avant, après) de chaque type d'entité"""
+
+
+def bytes_per_entity(factory, count: int) -> float:
+    """Retourne la mémoire allouée par entité créée avec `factory`."""
+    entities = [None] * count
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        entities[i] = factory(i * 0.5, i * 0.25)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10000)
+    args = parser.parse_args()
+
+    print(f"{args.count} entités par type")
+    print(f"{'type':>12} {'avant (o)':>10} {'après (o)':>10} {'gain':>8}")
+    for name, (legacy, current) in KINDS.items():
+        before = bytes_per_entity(legacy, args.count)
+        after = bytes_per_entity(current, args.count)
+        print(
+            f"{name:>12} {before:>10.0f} {after:>10.0f} "
+            f"{1 - after / before:>8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
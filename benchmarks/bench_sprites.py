@@ -0,0 +1,142 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""Compare le temps de préparation des images du jeu entre l'ancienne
+boucle pixel par pixel, `View.process_sprite` et le cache sur disque
+(`AssetCache`), et vérifie que le résultat est identique.
+
+Le temps total inclut le décodage et le redimensionnement, qui sont
+les mêmes pour les deux premières versions; la transparence seule est
+aussi mesurée.
+
+Utilisation (depuis la racine du projet):
+    python -m benchmarks.bench_sprites
+"""
+import argparse
+import time
+
+from PIL import Image  # type: ignore
+
+from AssetCache import AssetCache
+from View import (
+    View,
+    MenuView,
+    GameView,
+    HighscoreView,
+    OptionsView,
+    GameOverView,
+)
+
+SPRITES = list(dict.fromkeys([
+    *MenuView.assets(),
+    *GameView.assets(),
+    *HighscoreView.assets(),
+    *OptionsView.assets(),
+    *GameOverView.assets(),
+]))
+"""Images chargées par les vues, avec leur taille d'affichage"""
+
+
+def legacy_load(file: str, dimensions: tuple[int, int]) -> Image.Image:
+    """Ancienne version de `View.img_format`, sans la création de
+    `PhotoImage`.
+    """
+    img = Image.open(file)
+    img = img.resize(dimensions)
+    img = img.convert('RGBA')
+    return legacy_chroma_key(img)
+
+
+def legacy_chroma_key(img: Image.Image) -> Image.Image:
+    """Ancienne boucle qui rend le jaune pur transparent."""
+    data = img.getdata()
+
+    new_data = []
+    for item in data:
+        if item[0] == 255 and item[1] == 255 and item[2] == 0:
+            new_data.append((255, 255, 255, 0))
+        else:
+            new_data.append(item)
+
+    img.putdata(new_data)
+    return img
+
+
+def load_all(loader) -> float:
+    """Charge toutes les images et retourne le temps pris, en secondes."""
+    start = time.perf_counter()
+    for file, dimensions in SPRITES:
+        loader(file, dimensions)
+    return time.perf_counter() - start
+
+
+def key_all(images: list[Image.Image], chroma_key) -> float:
+    """Applique la transparence à une copie de chaque image et
+    retourne le temps pris, en secondes.
+    """
+    copies = [img.copy() for img in images]
+    start = time.perf_counter()
+    for img in copies:
+        chroma_key(img)
+    return time.perf_counter() - start
+
+
+def load_cached(file: str, dimensions: tuple[int, int]) -> Image.Image:
+    """Charge une image depuis le cache sur disque."""
+    return AssetCache.load(
+        file, dimensions, View.process_sprite, View.SPRITE_VERSION
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for file, dimensions in SPRITES:
+        expected = legacy_load(file, dimensions).tobytes()
+        for loader in (View.process_sprite, load_cached, load_cached):
+            if loader(file, dimensions).tobytes() != expected:
+                raise AssertionError(f"Résultat différent pour {file}")
+
+    resized = [
+        Image.open(file).resize(dimensions).convert('RGBA')
+        for file, dimensions in SPRITES
+    ]
+    rows = [
+        ("boucle pixel par pixel", legacy_load, legacy_chroma_key),
+        ("canaux PIL", View.process_sprite, View.chroma_key),
+        ("cache sur disque", load_cached, None),
+    ]
+    print(f"{len(SPRITES)} images")
+    print(f"{'':<24} {'total (ms)':>10} {'transparence (ms)':>18}")
+    for name, loader, chroma_key in rows:
+        total = min(load_all(loader) for _ in range(args.repeat))
+        if chroma_key is None:
+            key = "-"
+        else:
+            seconds = min(
+                key_all(resized, chroma_key) for _ in range(args.repeat)
+            )
+            key = f"{seconds * 1000:.1f}"
+        print(f"{name:<24} {total * 1000:10.1f} {key:>18}")
+
+
+if __name__ == "__main__":
+    main()
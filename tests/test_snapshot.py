@@ -0,0 +1,74 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""Tests de reprise d'une partie sauvegardée avec `Snapshot`.
+
+Utilisation (depuis la racine du projet):
+    python -m unittest discover tests
+"""
+import unittest
+
+from Controller import HeadlessGameController
+from Snapshot import Snapshot
+
+
+class SnapshotResumeTest(unittest.TestCase):
+    SEED = 1234
+    BEFORE = 300
+    """Ticks effectués avant la sauvegarde"""
+    AFTER = 300
+    """Ticks effectués après la sauvegarde"""
+
+    def start(self) -> HeadlessGameController:
+        controller = HeadlessGameController(self.SEED)
+        controller.move_cursor(400, 300)
+        controller.fire()
+        controller.run(self.BEFORE, stop_on_death=False)
+        return controller
+
+    def test_resume_matches_uninterrupted_game(self):
+        controller = self.start()
+        game, spawn = Snapshot.loads(
+            Snapshot.dumps(controller.game, controller.spawn_state())
+        )
+        resumed = HeadlessGameController(game=game, spawn=spawn)
+
+        controller.run(self.AFTER, stop_on_death=False)
+        resumed.run(self.AFTER, stop_on_death=False)
+        self.assertEqual(
+            Snapshot.dumps(resumed.game, resumed.spawn_state()),
+            Snapshot.dumps(controller.game, controller.spawn_state())
+        )
+
+    def test_spawn_state_round_trip(self):
+        controller = self.start()
+        controller.toggle_spawn()
+        _, spawn = Snapshot.loads(
+            Snapshot.dumps(controller.game, controller.spawn_state())
+        )
+        self.assertEqual(spawn, controller.spawn_state())
+
+    def test_without_spawn_state(self):
+        controller = self.start()
+        _, spawn = Snapshot.loads(Snapshot.dumps(controller.game))
+        self.assertIsNone(spawn)
+
+
+if __name__ == "__main__":
+    unittest.main()